@@ -57,6 +57,9 @@ class FResultsPage(QWidget):
         self.F_values = [0.2, 0.5]
         self.num_rows = 2  
 
+        # One FGraphicResults per row, so switching F only updates its figure
+        self._f_graphics = {}
+
         # Call setup_ui to build the interface.
         self.setup_ui()
 
@@ -145,7 +148,6 @@ class FResultsPage(QWidget):
 
         # Add the buttons layout to the main layout
         main_layout.addLayout(buttons_layout)
-        self.setLayout(main_layout)
 
     def handle_F_cell_clicked(self, row, column):
         """
@@ -173,10 +175,15 @@ class FResultsPage(QWidget):
 
         print(f"Using effective indices: {effective1} and {effective2}")
 
-        # Create an instance of FGraphicResults with the selected effective indices and wavelength.
-        f_graphics = FGraphicResults(effective1, effective2, self.lambd)
-        # Generate the plot for the selected F value.
-        fig = f_graphics.plot_F_graphs(F_value=F_value)
+        # Create an instance of FGraphicResults with the selected effective indices and
+        # wavelength, or reuse the one already plotting this row.
+        f_graphics = self._f_graphics.get(row)
+        if f_graphics is None:
+            f_graphics = FGraphicResults(effective1, effective2, self.lambd)
+            self._f_graphics[row] = f_graphics
+        # Generate the plot for the selected F value, blitting it into the open
+        # figure when possible.
+        fig = f_graphics.update(F_value)
         fig.show()
 
     def go_back(self):
@@ -11,9 +11,8 @@ using QStackedWidget. It allows navigation between:
 """
 
 
-from PySide6.QtWidgets import QWidget, QStackedWidget, QVBoxLayout
+from PySide6.QtWidgets import QApplication, QWidget, QStackedWidget, QVBoxLayout
 from gui.home_page import HomePage
-from PySide6.QtGui import QIcon
 
 
 class MainWindow(QWidget):
@@ -40,7 +39,7 @@ class MainWindow(QWidget):
         """
         super().__init__()
         self.setWindowTitle("egdopyma")                # Window title
-        self.setWindowIcon(QIcon("logo.png"))          # Window icon
+        self.setWindowIcon(QApplication.windowIcon())  # Window icon, loaded by main.py
         self.setMinimumSize(800, 600)                  # Minimum window size
 
         # Create a stacked widget to manage multiple pages
@@ -130,7 +130,6 @@ class MetodosAcopladosPage(QWidget):
 
         # Add the button layout to the main layout
         main_layout.addLayout(buttons_layout)
-        self.setLayout(main_layout)
 
     def go_back(self):
         """
@@ -9,14 +9,18 @@ to other parts of the application via the provided buttons.
 """
 
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import (
+    Qt, QSize, QEvent, QTimer, QObject, QRunnable, QThreadPool, Signal
+)
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QTableWidget, QTableWidgetItem, QHeaderView, QPushButton, 
-    QSizePolicy, QScrollArea
+    QSizePolicy, QScrollArea, QMessageBox
 )
 from PySide6.QtGui import QIcon
+import functools
 import math
+import numpy as np
 
 from methods.metodo_ondulatorio import metodo_ondulatorio
 from methods.metodo_rayos import metodo_rayo
@@ -25,6 +29,87 @@ from gui.metodos_acoplados_page import MetodosAcopladosPage
 from methods.GraphicResults import GraphicResults
 
 
+@functools.lru_cache(maxsize=64)
+def _cached_rayo(n_co, n_cl, h, lambd, ms):
+    """
+    Memoized metodo_rayo, so reopening the page with the same parameters
+    does not solve the modes again. The returned dict is shared between
+    callers and must not be mutated.
+    """
+    return metodo_rayo(n_co=n_co, n_cl=n_cl, h=h, lambd=lambd, ms=list(ms))
+
+
+_DEG2RAD = math.pi / 180.0
+
+# Stylesheet of every ResultsPage, kept as one string object shared by all instances
+_STYLESHEET = """
+    QWidget {
+        background-color: #f0f0f0;
+        font-family: 'Helvetica';
+    }
+    QTableWidget {
+        background-color: #ffffff;
+        border: 1px solid #dddddd;
+        gridline-color: #cccccc;
+    }
+    QHeaderView::section {
+        background-color: #ffffff;
+        color: #2c3e50;
+        font-weight: bold;
+        border: 1px solid #dddddd;
+    }
+    QPushButton {
+        background-color: #2c3e50;
+        color: white;
+        border-radius: 4px;
+        padding: 6px 12px;
+        margin: 0px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #1f2d3d;
+    }
+"""
+
+
+class SolverSignals(QObject):
+    """
+    Signals of a SolverWorker (a QRunnable is not a QObject and cannot emit).
+    """
+    finished = Signal(object)
+    error = Signal(object)
+
+
+class SolverWorker(QRunnable):
+    """
+    Runs a solver function in the thread pool and emits its result through
+    signals.finished, which Qt delivers in the thread of the receiver. If the
+    solver raises, the exception is emitted through signals.error instead.
+
+    Args:
+        solver (callable): The function to run, e.g. _cached_rayo.
+        kwargs (dict): Keyword arguments for the solver.
+    """
+
+    def __init__(self, solver, kwargs):
+        super().__init__()
+        self.solver = solver
+        self.kwargs = kwargs
+        self.signals = SolverSignals()
+
+    def run(self):
+        """
+        Calls the solver and emits its result, or the exception it raised
+        (an exception escaping run() would only be printed by Qt).
+        """
+        try:
+            result = self.solver(**self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(e)
+            return
+        self.signals.finished.emit(result)
+
+
 class ResultsPage(QWidget):
     """
     A QWidget subclass that displays the results of two numerical methods
@@ -42,6 +127,10 @@ class ResultsPage(QWidget):
         "rayos": r"$2n_{co}k_0h\cos(\theta)-2\phi_s-2\phi_{cl}=2m\pi^2$",
         "ondulatorio": r"$W^2+U(\theta)^2 =\left(\frac{k_0 h}{2}\right)^2(n_{co}^2 - n_{cl}^2)$"
     }
+    PHI_EQUATIONS = {
+        "TE": r"$\phi_{TE} = \tan^{-1}[\frac{n_t}{n_i \cos(\theta)} \sqrt{\frac{n_i^2}{n_t^2}\sin^2(\theta) - 1}]$",
+        "TM": r"$\phi_{TM} = \tan^{-1}[\frac{n_i}{n_t \cos(\theta)} \sqrt{\frac{n_i^2}{n_t^2}\sin^2(\theta) - 1}]$"
+    }
     VERTICAL_HEADERS = [
         r"$TE$",
         r"$TM$",
@@ -56,6 +145,14 @@ class ResultsPage(QWidget):
 
     N = 4  # Number of rows
     M = 3  # Number of columns
+    ICON_SIZE = QSize(100, 40)  # Header icon size (px)
+    ROW_HEIGHT = 48  # Fixed row height (px), fits the ICON_SIZE header icons
+
+    # Rendered equation pixmaps, shared by all instances (see _ensure_eq_pixmaps)
+    _eq_pixmaps = None
+    _phi_pixmaps = None
+    # Header icons keyed by (LaTeX string, fontsize), shared by all instances
+    _header_icons = {}
 
     def __init__(self, parent: QWidget, stack, n_co, n_cl, h, lambd):
         """
@@ -76,46 +173,59 @@ class ResultsPage(QWidget):
         self.h = h
         self.lambd = lambd
         self.stack = stack
-        self.alpha_TE = [0] * 3
-        self.alpha_TM = [0] * 3
-        self.n_eff_TE = [0] * 3
-        self.n_eff_TM = [0] * 3
+        # Rows: alpha TE, alpha TM, n_eff TE, n_eff TM (one column per m)
+        self._values = np.zeros((self.N, self.M), dtype=np.float64)
+        self.tables = []
+        self.results_rayo = None        # Set when the rayos worker finishes
+        self.results_ondulatorio = None  # Set when the ondulatorio worker finishes
+        self._solver_failed = False  # Set once a solver error has been reported
+        self._gr = None        # GraphicResults, created on the first cell click
+        self._fig_cache = {}   # (mode, m) -> open field figure
+        self._acoplados_cache = {}  # (n_eff_TE, n_eff_TM, lambd) -> MetodosAcopladosPage
+        self._ensure_eq_pixmaps()
         self.setup_ui()
 
+    @property
+    def alpha_TE(self):
+        """list: Angles of the TE modes in degrees, one per m."""
+        return self._values[0].tolist()
+
+    @property
+    def alpha_TM(self):
+        """list: Angles of the TM modes in degrees, one per m."""
+        return self._values[1].tolist()
+
+    @property
+    def n_eff_TE(self):
+        """list: Effective indices of the TE modes, one per m."""
+        return self._values[2].tolist()
+
+    @property
+    def n_eff_TM(self):
+        """list: Effective indices of the TM modes, one per m."""
+        return self._values[3].tolist()
+
+    @classmethod
+    def _ensure_eq_pixmaps(cls):
+        """
+        Renders the EQUATIONS and PHI_EQUATIONS pixmaps the first time a page
+        is created. Later pages reuse them instead of running matplotlib again.
+        """
+        if cls._eq_pixmaps is None:
+            cls._eq_pixmaps = {
+                k: LatexLabel.latex_to_pixmap(v, fontsize=12) for k, v in cls.EQUATIONS.items()
+            }
+            cls._phi_pixmaps = {
+                k: LatexLabel.latex_to_pixmap(v, fontsize=10) for k, v in cls.PHI_EQUATIONS.items()
+            }
+
     def setup_ui(self):
         """
         Sets up the UI layout, including tables for displaying results,
         and a scroll bar. The phi equations appear above the rayos table.
         """
         # 1) Apply a stylesheet removing the color for row/col headers
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f0f0f0;
-                font-family: 'Helvetica';
-            }
-            QTableWidget {
-                background-color: #ffffff;
-                border: 1px solid #dddddd;
-                gridline-color: #cccccc;
-            }
-            QHeaderView::section {
-                background-color: #ffffff;
-                color: #2c3e50;
-                font-weight: bold;
-                border: 1px solid #dddddd;
-            }
-            QPushButton {
-                background-color: #2c3e50;
-                color: white;
-                border-radius: 4px;
-                padding: 6px 12px;
-                margin: 0px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #1f2d3d;
-            }
-        """)
+        self.setStyleSheet(_STYLESHEET)
 
         # 2) Create a QScrollArea to hold all content
         scroll_area = QScrollArea()
@@ -125,71 +235,17 @@ class ResultsPage(QWidget):
         container_layout.setContentsMargins(20, 20, 20, 20)
         container_layout.setSpacing(15)
 
-        # 3) Tables layout
-        tables_layout = QHBoxLayout()
-        table_layouts = []
-
-        for method in self.METHODS:
-            layout_table = QVBoxLayout()
-
-            # Title label
-            title = QLabel(self.TITLES[method])
-            title.setObjectName("titleLabel")
-            layout_table.addWidget(title)
-
-            description = QLabel("Vamos a encontrar valores para el ángulo θ que resuelvan la siguiente ecuación")
-            description.setWordWrap(True)
-            layout_table.addWidget(description)
-
-            # Equation
-            main_eq = LatexLabel(self.EQUATIONS[method], fontsize=12)
-            layout_table.addWidget(main_eq)
-
-            # Create table
-            table = QTableWidget(self.N, self.M)
-            table.horizontalHeader().setIconSize(QSize(100, 40))
-            table.verticalHeader().setIconSize(QSize(100, 40))
-
-            vertical_headers_items = self.getHeaders(self.VERTICAL_HEADERS, fontsize=18)
-            for i in range(self.N):
-                table.setVerticalHeaderItem(i, vertical_headers_items[i])
-            for i in range(self.M):
-                table.setHorizontalHeaderItem(i, QTableWidgetItem(self.HORIZONTAL_HEADERS[i]))
-
-            table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            table.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-            layout_table.addWidget(table)
-            table_layouts.append(layout_table)
-
-            # Fill table
-            if method == "rayos":
-                self.fillTableRayos(table)
-            else:
-                self.fillTableOndulatorio(table)
-                table.cellClicked.connect(self.handle_ondulatorio_cell_clicked)
-
-            # If it's "rayos", show the phi equations ABOVE the table
-            if method == "rayos":
-                eq_phi_te = LatexLabel(
-                    r"$\phi_{TE} = \tan^{-1}[\frac{n_t}{n_i \cos(\theta)} \sqrt{\frac{n_i^2}{n_t^2}\sin^2(\theta) - 1}]$",
-                    fontsize=10
-                )
-                eq_phi_tm = LatexLabel(
-                    r"$\phi_{TM} = \tan^{-1}[\frac{n_i}{n_t \cos(\theta)} \sqrt{\frac{n_i^2}{n_t^2}\sin^2(\theta) - 1}]$",
-                    fontsize=10
-                )
-                layout_table.addWidget(eq_phi_te, alignment=Qt.AlignCenter)
-                layout_table.addWidget(eq_phi_tm, alignment=Qt.AlignCenter)
-
-        # 4) Add both table layouts side by side
-        for layout in table_layouts:
-            tables_layout.addLayout(layout)
-
-        container_layout.addLayout(tables_layout)
+        # 3) Tables layout. Only the rayos column is built here; the ondulatorio
+        #    column (and its solver run) waits behind a placeholder until it is
+        #    scrolled into view, see load_ondulatorio.
+        self.tables_layout = QHBoxLayout()
+        self.tables_layout.addWidget(self.buildColumn("rayos"))
+
+        self.ondulatorio_placeholder = QWidget()
+        self.ondulatorio_placeholder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.tables_layout.addWidget(self.ondulatorio_placeholder)
+
+        container_layout.addLayout(self.tables_layout)
 
         # 5) Buttons layout
         buttons_layout = QHBoxLayout()
@@ -209,15 +265,148 @@ class ResultsPage(QWidget):
 
         # 6) Put container_widget in the scroll area
         scroll_area.setWidget(container_widget)
+        scroll_area.horizontalScrollBar().valueChanged.connect(self.load_ondulatorio)
+        scroll_area.verticalScrollBar().valueChanged.connect(self.load_ondulatorio)
 
         # 7) Final layout
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(scroll_area)
-        self.setLayout(main_layout)
+
+    def buildColumn(self, method):
+        """
+        Builds the column of one method: title, description, main equation and
+        results table (plus the phi equations for rayos), and fills the table.
+
+        Args:
+            method (str): "rayos" or "ondulatorio".
+
+        Returns:
+            QWidget: The widget holding the column.
+        """
+        column = QWidget()
+        layout_table = QVBoxLayout(column)
+        layout_table.setContentsMargins(0, 0, 0, 0)
+
+        # Title label
+        title = QLabel(self.TITLES[method])
+        title.setObjectName("titleLabel")
+        layout_table.addWidget(title)
+
+        description = QLabel("Vamos a encontrar valores para el ángulo θ que resuelvan la siguiente ecuación")
+        description.setWordWrap(True)
+        layout_table.addWidget(description)
+
+        # Equation
+        main_eq = QLabel()
+        main_eq.setPixmap(self._eq_pixmaps[method])
+        layout_table.addWidget(main_eq)
+
+        # Create table
+        table = QTableWidget(self.N, self.M)
+        table.horizontalHeader().setIconSize(self.ICON_SIZE)
+        table.verticalHeader().setIconSize(self.ICON_SIZE)
+
+        vertical_headers_items = self.getHeaders(self.VERTICAL_HEADERS, fontsize=18)
+        for i in range(self.N):
+            table.setVerticalHeaderItem(i, vertical_headers_items[i])
+        for i in range(self.M):
+            table.setHorizontalHeaderItem(i, QTableWidgetItem(self.HORIZONTAL_HEADERS[i]))
+
+        table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # Fixed section sizes: Qt no longer re-measures the icon headers on every
+        # setItem; the column width is recomputed once per resize in eventFilter.
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        layout_table.addWidget(table)
+        self.tables.append(table)
+        table.viewport().installEventFilter(self)
+
+        # Fill table
+        items = self.createItems(table)
+        if method == "rayos":
+            self._items_rayos = items
+            self.fillTableRayos()
+        else:
+            self._items_ondulatorio = items
+            self.fillTableOndulatorio()
+            table.cellClicked.connect(self.handle_ondulatorio_cell_clicked)
+
+        # If it's "rayos", show the phi equations ABOVE the table
+        if method == "rayos":
+            # Both equations go in one container, added to the column at once
+            phi_container = QWidget()
+            phi_layout = QVBoxLayout(phi_container)
+            phi_layout.setContentsMargins(0, 0, 0, 0)
+            for modo in ("TE", "TM"):
+                eq_phi = QLabel()
+                eq_phi.setPixmap(self._phi_pixmaps[modo])
+                phi_layout.addWidget(eq_phi, alignment=Qt.AlignCenter)
+            layout_table.addWidget(phi_container, alignment=Qt.AlignCenter)
+
+        return column
+
+    def load_ondulatorio(self):
+        """
+        Replaces the ondulatorio placeholder with the real column once the
+        placeholder is visible in the scroll area. Called on scroll and when
+        the page is shown; does nothing after the column has been built.
+        """
+        if self.ondulatorio_placeholder is None:
+            return
+        if self.ondulatorio_placeholder.visibleRegion().isEmpty():
+            return
+        self.ensureOndulatorio()
+
+    def ensureOndulatorio(self):
+        """
+        Builds the ondulatorio column in place of its placeholder, if that has
+        not happened yet.
+        """
+        if self.ondulatorio_placeholder is None:
+            return
+        placeholder = self.ondulatorio_placeholder
+        self.ondulatorio_placeholder = None
+        self.tables_layout.replaceWidget(placeholder, self.buildColumn("ondulatorio"))
+        placeholder.deleteLater()
+
+    def showEvent(self, event):
+        """
+        Checks, once the page is laid out, whether the ondulatorio column is
+        already in view.
+
+        Args:
+            event (QShowEvent): The show event.
+        """
+        super().showEvent(event)
+        QTimer.singleShot(0, self.load_ondulatorio)
+
+    def eventFilter(self, watched, event):
+        """
+        Recomputes the fixed column width of a table once per resize of its
+        viewport, so the columns keep filling the available width.
+
+        Args:
+            watched (QObject): The object receiving the event.
+            event (QEvent): The event being delivered.
+
+        Returns:
+            bool: The base implementation result; the event is not consumed here.
+        """
+        if event.type() == QEvent.Resize:
+            table = watched.parent()
+            if table in self.tables:
+                table.horizontalHeader().setDefaultSectionSize(event.size().width() // self.M)
+        return super().eventFilter(watched, event)
 
     def getHeaders(self, headers, fontsize=16):
         """
         Converts header LaTeX strings into QTableWidgetItems with icons.
+        The icons are rendered once per (header, fontsize) and shared by
+        every table and page.
 
         Args:
             headers (list): A list of LaTeX strings for the table headers.
@@ -228,62 +417,137 @@ class ResultsPage(QWidget):
         """
         headers_items = []
         for h in headers:
-            latex_pixmap = LatexLabel.latex_to_pixmap(h, fontsize=fontsize)
+            icon = self._header_icons.get((h, fontsize))
+            if icon is None:
+                latex_pixmap = LatexLabel.latex_to_pixmap(h, fontsize=fontsize)
+                # Bound the pixmap to the icon size once, so Qt never rescales it on paint
+                if latex_pixmap.width() > self.ICON_SIZE.width() or latex_pixmap.height() > self.ICON_SIZE.height():
+                    latex_pixmap = latex_pixmap.scaled(self.ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                icon = self._header_icons.setdefault((h, fontsize), QIcon(latex_pixmap))
             item = QTableWidgetItem()
-            item.setIcon(QIcon(latex_pixmap))
+            item.setIcon(icon)
             headers_items.append(item)
         return headers_items
 
-    def fillTableRayos(self, table):
+    def createItems(self, table):
         """
-        Computes and fills the table with results from the rayos method.
+        Allocates one QTableWidgetItem per cell of the table, once. They show
+        "..." until the results arrive; filling the table only changes their text.
 
         Args:
-            table (QTableWidget): The table to fill with computed results.
+            table (QTableWidget): The table to populate with empty items.
+
+        Returns:
+            list: An N x M grid (list of rows) with the items of the table.
         """
-        self.results_rayo = metodo_rayo(
-            n_co=self.n_co,
-            n_cl=self.n_cl,
-            h=self.h,
-            lambd=self.lambd,
-            ms=range(self.M)
-        )
-        self.fillTable(table, self.results_rayo)
+        items = []
+        for r in range(self.N):
+            row = []
+            for c in range(self.M):
+                item = QTableWidgetItem("...")
+                table.setItem(r, c, item)
+                row.append(item)
+            items.append(row)
+        return items
+
+    def fillTableRayos(self):
+        """
+        Computes the results of the rayos method in the thread pool; the
+        table is filled by onRayosSolved when they are ready.
+        """
+        worker = SolverWorker(_cached_rayo, self.solverArgs())
+        worker.signals.finished.connect(self.onRayosSolved)
+        worker.signals.error.connect(self.onSolverError)
+        QThreadPool.globalInstance().start(worker)
 
-    def fillTableOndulatorio(self, table):
+    def fillTableOndulatorio(self):
+        """
+        Computes the results of the ondulatorio method in the thread pool; the
+        table is filled by onOndulatorioSolved when they are ready.
         """
-        Computes and fills the table with results from the ondulatorio method.
+        worker = SolverWorker(metodo_ondulatorio, self.solverArgs())
+        worker.signals.finished.connect(self.onOndulatorioSolved)
+        worker.signals.error.connect(self.onSolverError)
+        QThreadPool.globalInstance().start(worker)
+
+    def onSolverError(self, error):
+        """
+        Reports a solver failure (e.g. the waveguide has fewer modes than the
+        table shows) and goes back to the form. Both solvers usually fail for
+        the same input, so only the first error is shown.
 
         Args:
-            table (QTableWidget): The table to fill with computed results.
+            error (Exception): The exception raised by the solver.
         """
-        self.results_ondulatorio = metodo_ondulatorio(
-            n_co=self.n_co,
-            n_cl=self.n_cl,
-            h=self.h,
-            lambd=self.lambd,
-            ms=range(self.M)
-        )
-        self.fillTable(table, self.results_ondulatorio)
+        if self._solver_failed:
+            return
+        self._solver_failed = True
+        print(error)
+        QMessageBox.critical(self, "Error!", "The current values are not valid, check your input", QMessageBox.Ok)
+        self.go_to_form()
 
-    def fillTable(self, table, results):
+    def solverArgs(self):
+        """
+        Returns the keyword arguments shared by both solvers, which memoize
+        their results (see _cached_rayo and metodo_ondulatorio).
+
+        Returns:
+            dict: n_co, n_cl, h, lambd and the tuple of mode indices.
+        """
+        return {
+            "n_co": self.n_co,
+            "n_cl": self.n_cl,
+            "h": self.h,
+            "lambd": self.lambd,
+            "ms": tuple(range(self.M))
+        }
+
+    def onRayosSolved(self, results):
+        """
+        Receives the rayos results from the thread pool and fills its table.
+
+        Args:
+            results (dict): The result of metodo_rayo.
+        """
+        self.results_rayo = results
+        self.fillTable(self._items_rayos, results)
+
+    def onOndulatorioSolved(self, results):
+        """
+        Receives the ondulatorio results from the thread pool, fills its table
+        and keeps the angles and effective indices used by the next pages.
+
+        Args:
+            results (dict): The result of metodo_ondulatorio.
+        """
+        self.results_ondulatorio = results
+        self._values[:] = self.fillTable(self._items_ondulatorio, results)
+
+    def fillTable(self, items, results):
         """
         Populates the table with numerical results for TE and TM modes.
+        Only the text of the existing items is updated.
 
         Args:
-            table (QTableWidget): The table where results are placed.
+            items (list): The item grid of the table (see createItems).
             results (dict): A dictionary containing "TE" and "TM" lists 
                             with the computed angles.
+
+        Returns:
+            numpy.ndarray: The N x M values shown in the table, with rows
+                           alpha TE, alpha TM, n_eff TE and n_eff TM.
         """
+        values = np.empty((self.N, self.M), dtype=np.float64)
         for m in range(self.M):
-            self.alpha_TE[m] = round(results["TE"][m], 1)
-            self.alpha_TM[m] = round(results["TM"][m], 1)
-            self.n_eff_TE[m] = round(math.sin(math.radians(self.alpha_TE[m])) * self.n_co, 2)
-            self.n_eff_TM[m] = round(math.sin(math.radians(self.alpha_TM[m])) * self.n_co, 2)
-            table.setItem(0, m, QTableWidgetItem(str(self.alpha_TE[m])))
-            table.setItem(1, m, QTableWidgetItem(str(self.alpha_TM[m])))
-            table.setItem(2, m, QTableWidgetItem(str(self.n_eff_TE[m])))
-            table.setItem(3, m, QTableWidgetItem(str(self.n_eff_TM[m])))
+            values[0, m] = results["TE"][m]
+            values[1, m] = results["TM"][m]
+        np.round(values[0:2], 1, out=values[0:2])
+        values[2:4] = np.round(np.sin(values[0:2] * _DEG2RAD) * self.n_co, 2)
+
+        for r, row in enumerate(values.tolist()):
+            for m, value in enumerate(row):
+                items[r][m].setText(str(value))
+        return values
 
     def handle_ondulatorio_cell_clicked(self, row, column):
         """
@@ -291,7 +555,8 @@ class ResultsPage(QWidget):
 
         For the first two rows (row 0 for TE, row 1 for TM), this method 
         generates a pop-up graphic with two plots (E and H fields) corresponding 
-        to the clicked mode and m value.
+        to the clicked mode and m value. The figure is reused while its
+        window stays open.
 
         Args:
             row (int): The row index in the table.
@@ -301,9 +566,26 @@ class ResultsPage(QWidget):
             return
 
         mode = "TE" if row == 0 else "TM"
-        m_index = column
-        gr = GraphicResults(self.n_co, self.n_cl, self.h, self.lambd)
-        fig = gr.plot_fields(mode, m_index)
+        if self._gr is None:
+            # Cheap to build: each mode is only solved when it is first plotted
+            self._gr = GraphicResults(self.n_co, self.n_cl, self.h, self.lambd)
+        self.showFields((mode, column))
+
+    def showFields(self, key):
+        """
+        Shows the E and H field figure of one mode. The figure is built with
+        pyplot, so this must run in the GUI thread.
+
+        Args:
+            key (tuple): The mode ("TE" or "TM") and the mode index m.
+        """
+        mode, m_index = key
+        fig = self._fig_cache.get(key)
+        if fig is None:
+            fig = self._gr.plot_fields(mode, m_index)
+            self._fig_cache[key] = fig
+            # Once the window is closed the figure cannot be shown again, drop it
+            fig.canvas.mpl_connect("close_event", lambda event, key=key: self._fig_cache.pop(key, None))
         fig.show()
 
     def go_to_form(self):
@@ -314,8 +596,25 @@ class ResultsPage(QWidget):
 
     def go_to_metodos_acoplados(self):
         """
-        Navigates to the Metodos Acoplados page.
+        Navigates to the Metodos Acoplados page. The page is created once per
+        (n_eff_TE, n_eff_TM, lambd) and reused on later visits.
         """
-        metodos_page = MetodosAcopladosPage(self, self.stack, self.n_eff_TE, self.n_eff_TM, self.lambd)
-        self.stack.addWidget(metodos_page)
+        # The effective indices come from the ondulatorio results; if the worker
+        # has not delivered them yet, solve here (the solver is memoized)
+        self.ensureOndulatorio()
+        if self.results_ondulatorio is None:
+            try:
+                results = metodo_ondulatorio(**self.solverArgs())
+            except ValueError as e:
+                self.onSolverError(e)
+                return
+            self.onOndulatorioSolved(results)
+        key = (tuple(self.n_eff_TE), tuple(self.n_eff_TM), self.lambd)
+        metodos_page = self._acoplados_cache.get(key)
+        if metodos_page is None:
+            metodos_page = MetodosAcopladosPage(self, self.stack, self.n_eff_TE, self.n_eff_TM, self.lambd)
+            self._acoplados_cache[key] = metodos_page
+        # Its Back button removes the page from the stack, add it again if needed
+        if self.stack.indexOf(metodos_page) == -1:
+            self.stack.addWidget(metodos_page)
         self.stack.setCurrentWidget(metodos_page)
@@ -6,15 +6,27 @@ and starts the event loop.
 """
 
 
+import os
 import sys
+import matplotlib
+
+# Figures are shown as Qt windows; pick the backend once, before any
+# module imports pyplot
+matplotlib.use('QtAgg')
+
 from gui.main_window import MainWindow
 from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QPixmap
+
+# Next to this file rather than the working directory
+_LOGO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logo.png")
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("logo.png"))  
+    # Decoded once; windows reuse it through app.windowIcon()
+    _pix = QPixmap(_LOGO)
+    app.setWindowIcon(QIcon(_pix))
 
     # Instantiate and display the main window
     window = MainWindow()
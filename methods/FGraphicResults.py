@@ -13,13 +13,19 @@ Usage:
     f_results = FGraphicResults(n_eff1=1.45, n_eff2=1.29, lambd=1.0)
     fig = f_results.plot_F_graphs(F_value=0.2)
     fig.show()
+
+    # By default the curves are sampled adaptively (at most 100 points);
+    # x_points asks for that many uniformly spaced points instead
+    fig = f_results.plot_F_graphs(F_value=0.2, x_points=400)
 """
 
+import math
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
 
-matplotlib.use('qtagg')
+_HALF_PI = 0.5 * math.pi
+_TWO_PI = 2.0 * math.pi
+# Point budget of the adaptive grid, and uniform points of the multi-F plot
+_DEFAULT_POINTS = 100
 
 class FGraphicResults:
     """
@@ -52,18 +58,28 @@ class FGraphicResults:
         self.beta2 = self.get_beta(n_eff2, lambd)
         # Delta is defined as half the difference between beta1 and beta2.
         self.delta = self.get_delta(self.beta1, self.beta2)
-
-    def get_lc(self, psi):
-        """
-        Computes the coupling length (L_c) given psi.
-
-        Args:
-            psi (float): The psi parameter derived from kappa and delta.
-
-        Returns:
-            float: The coupling length as π/(2 * psi).
-        """
-        return np.pi / 2 * psi
+        # Invariants of the instance used on every plot
+        self._delta_sq = self.delta ** 2
+        self._param_prefix = (
+            r"$n_{eff_1} = " + f"{n_eff1}" +
+            r",\quad n_{eff_2} = " + f"{n_eff2}" +
+            r",\quad \lambda = " + f"{lambd}" + r"$" + "\n" + r"$" +
+            r"\quad \beta_1 = " + f"{self.beta1:.2f}" +
+            r",\quad \beta_2 = " + f"{self.beta2:.2f}" +
+            r",\quad \delta = " + f"{self.delta:.2f}" + r"$" + "\n"
+        )
+        # Figure reused by plot_F_graphs, with its screen canvas, artists,
+        # current tick count and the background saved for blitting in update()
+        self._fig = None
+        self._canvas = None
+        self._ax = None
+        self._pa_line = None
+        self._pb_line = None
+        self._info_text = None
+        self._N = None
+        self._bg = None
+        # x-tick positions and labels per tick count, see _ticks_for
+        self._tick_cache = {}
 
     def get_beta(self, n_eff, lambd):
         """
@@ -76,7 +92,7 @@ class FGraphicResults:
         Returns:
             float: The computed beta.
         """
-        k0 = 2 * np.pi / lambd
+        k0 = _TWO_PI / lambd
         return k0 * n_eff
 
     def get_delta(self, beta1, beta2):
@@ -114,7 +130,7 @@ class FGraphicResults:
         Returns:
             float: The computed psi.
         """
-        return np.sqrt(self.delta**2 + kappa**2)
+        return np.sqrt(self._delta_sq + kappa * kappa)
 
     def Pa(self, z, psi, F):
         """
@@ -128,7 +144,7 @@ class FGraphicResults:
         Returns:
             array-like: Computed Pa values at each point in z.
         """
-        return 1 - F * np.sin(psi * z)**2
+        return 1 - F * self._couple_state(z, psi)[1]
 
     def Pb(self, z, psi, F):
         """
@@ -142,96 +158,378 @@ class FGraphicResults:
         Returns:
             array-like: Computed Pb values at each point in z.
         """
-        return F * np.sin(psi * z)**2
+        return F * self._couple_state(z, psi)[1]
+
+    def _couple_state(self, z, psi):
+        """
+        Computes the oscillating part shared by every coupling quantity,
+        sin(psi*z) and sin^2(psi*z), evaluating the sine only once.
+
+        Args:
+            z (array-like): x values.
+            psi (float): The psi parameter.
+
+        Returns:
+            tuple: (sin(psi*z), sin^2(psi*z)) as new arrays.
+        """
+        s = np.multiply(z, psi)
+        # In place for arrays; a scalar z gives a NumPy scalar, which cannot be an out=
+        s = np.sin(s, out=s) if isinstance(s, np.ndarray) else np.sin(s)
+        return s, np.multiply(s, s)
+
+    def _compute_pa_pb(self, z, psi, F):
+        """
+        Computes Pa and Pb together from a single _couple_state evaluation.
+
+        Args:
+            z (array-like): x values.
+            psi (float): The psi parameter.
+            F (float): The F parameter.
+
+        Returns:
+            tuple: (Pa, Pb) arrays, with Pb = F * sin^2(psi*z) and Pa = 1 - Pb.
+        """
+        # sin^2 is a fresh array, so Pb is built in its buffer
+        _, pb = self._couple_state(z, psi)
+        np.multiply(pb, F, out=pb)
+        pa = np.subtract(1.0, pb)
+        return pa, pb
 
-    def plot_F_graphs(self, F_value, x_points=100):
+    def plot_F_graphs(self, F_value, x_points=None):
         """
         Generates and returns a matplotlib figure for a single F value.
         The plot displays the curves for Pa(z) and Pb(z) versus z, and additional
         information is shown below the graph.
+
+        The figure is built on the first call and reused afterwards: later calls
+        only update the curves, title, ticks and parameter text. Closing the
+        figure window discards it, so the next call builds a new one.
+
+        If F_value is a sequence, a new figure with one subplot per F value is
+        returned instead (see _plot_multi_F).
         
         Args:
-            F_value (float): The F value to plot.
-            x_points (int, optional): Number of points for the x-axis. Defaults to 100.
+            F_value (float or array-like): The F value(s) to plot.
+            x_points (int, optional): Number of uniformly spaced points for the
+                x-axis. If None (default), the single F curves are sampled
+                adaptively with at most 100 points (see _adaptive_grid), and
+                the multi-F subplots use 100 uniform points.
             
         Returns:
             matplotlib.figure.Figure: The generated figure.
         """
-        # Create a figure and axis
-        fig, ax = plt.subplots(figsize=(7, 4))
+        if np.ndim(F_value) > 0:
+            return self._plot_multi_F(F_value, x_points)
+
+        kappa, psi, l_c, N, x_range, pa_values, pb_values = self._curves(F_value, x_points)
+
+        if self._fig is None:
+            # pyplot is only needed to plot; importing it lazily keeps the
+            # numeric methods usable without loading matplotlib
+            import matplotlib.pyplot as plt
+
+            # Create a figure and axis
+            fig, ax = plt.subplots(figsize=(7, 4))
+
+            # Plot Pa and Pb with distinct styles
+            self._pa_line, = ax.plot(x_range, pa_values, label=r"$P_a(z)$", color="royalblue", linewidth=2)
+            self._pb_line, = ax.plot(x_range, pb_values, label=r"$P_b(z)$", color="crimson", linewidth=2)
+
+            ax.set_xlabel("z", fontsize=11)
+            ax.set_ylabel("", fontsize=11)
+            ax.set_title(rf"$F = {F_value}$", fontsize=13)
+            ax.legend(fontsize=10)
+
+            # Enable grid for clarity
+            ax.grid(True, linestyle=":", color="gray", alpha=0.3)
+
+            self._set_ticks(ax, N)
+            self._N = N
+
+            # Tight layout, reserving space at the bottom for additional info
+            fig.tight_layout(rect=(0, 0.3, 1, 0.95))
+
+            # Place a bold 'Parameters' title below the main plot
+            fig.text(0.5, 0.2, "Parameters", ha="center", va="bottom", fontsize=12, fontweight="bold")
+
+            # Additional info text, filled below for every call
+            self._info_text = fig.text(0.5, 0.05, "", ha="center", va="bottom", fontsize=10)
+
+            # The curves, title and info text change with F: they are drawn
+            # on top of the cached background so update() can blit them
+            for artist in (self._pa_line, self._pb_line, ax.title, self._info_text):
+                artist.set_animated(True)
+
+            fig.canvas.mpl_connect("draw_event", self._on_draw)
+            fig.canvas.mpl_connect("close_event", self._discard_figure)
+            self._fig, self._ax = fig, ax
+            self._canvas = fig.canvas
+        else:
+            # Reuse the cached figure: only the data and labels change
+            ax = self._ax
+            self._pa_line.set_data(x_range, pa_values)
+            self._pb_line.set_data(x_range, pb_values)
+            ax.relim()
+            ax.autoscale_view()
+            ax.set_title(rf"$F = {F_value}$", fontsize=13)
+            if N != self._N:
+                self._set_ticks(ax, N)
+                self._N = N
+            self._fig.canvas.draw_idle()
+
+        # Place the additional info text below the 'Parameters' title
+        self._info_text.set_text(self._info_for(kappa, psi, l_c))
+
+        return self._fig
+
+    def update(self, F_value, x_points=None):
+        """
+        Updates the figure from plot_F_graphs for a new F value.
 
+        When the x-axis is unchanged (same number of pi/2 ticks), only the curves, title and info text are redrawn over the cached
+        background and blitted to the canvas. Otherwise, or if the figure has
+        not been drawn yet, this falls back to plot_F_graphs.
+
+        Args:
+            F_value (float): The F value to plot.
+            x_points (int, optional): Number of uniformly spaced points for the
+                x-axis, or None (default) for the adaptive grid, as in plot_F_graphs.
+
+        Returns:
+            matplotlib.figure.Figure: The updated figure.
+        """
+        if self._fig is None or self._bg is None:
+            return self.plot_F_graphs(F_value, x_points)
+
+        kappa, psi, l_c, N, x_range, pa_values, pb_values = self._curves(F_value, x_points)
+        if N != self._N:
+            return self.plot_F_graphs(F_value, x_points)
+
+        # The grid depends on psi, but it always spans [0, N*pi/2], so the
+        # axis limits in the background are still right
+        self._pa_line.set_data(x_range, pa_values)
+        self._pb_line.set_data(x_range, pb_values)
+        self._ax.set_title(rf"$F = {F_value}$", fontsize=13)
+        self._info_text.set_text(self._info_for(kappa, psi, l_c))
+
+        canvas = self._fig.canvas
+        canvas.restore_region(self._bg)
+        self._draw_animated()
+        canvas.blit(self._fig.bbox)
+        return self._fig
+
+    def _curves(self, F_value, x_points):
+        """
+        Computes everything plot_F_graphs and update need for one F value.
+
+        Args:
+            F_value (float): The F value to plot.
+            x_points (int or None): Number of uniform points for the x-axis,
+                or None for the adaptive grid.
+
+        Returns:
+            tuple: (kappa, psi, l_c, N, x_range, Pa, Pb).
+        """
         # Compute kappa and psi for the given F value
         kappa = self.get_kappa(F_value)
         psi = self.get_psi(kappa)
-        l_c = (np.pi / 2) * psi  # Coupling length
+        l_c = _HALF_PI * psi  # Coupling length
 
         # Determine the maximum x-value in multiples of pi/2
-        x_max_original = (2 * np.pi) / psi
-        N = int(np.ceil(x_max_original / (np.pi / 2)))
-        max_tick = N * (np.pi / 2)
-
-        # Generate x range and compute Pa/Pb
-        x_range = np.linspace(0, max_tick, x_points)
-        pa_values = self.Pa(x_range, psi, F_value)
-        pb_values = self.Pb(x_range, psi, F_value)
-
-        # Plot Pa and Pb with distinct styles
-        ax.plot(x_range, pa_values, label=r"$P_a(z)$", color="royalblue", linewidth=2)
-        ax.plot(x_range, pb_values, label=r"$P_b(z)$", color="crimson", linewidth=2)
-
-        ax.set_xlabel("z", fontsize=11)
-        ax.set_ylabel("", fontsize=11)
-        ax.set_title(rf"$F = {F_value}$", fontsize=13)
-        ax.legend(fontsize=10)
-
-        # Enable grid for clarity
-        ax.grid(True, linestyle=":", color="gray", alpha=0.3)
-
-        # Set x-ticks at increments of pi/2
-        tick_positions = [n * (np.pi / 2) for n in range(N + 1)]
-        tick_labels = []
-        for n in range(N + 1):
-            if n == 0:
-                tick_labels.append("0")
-            elif n == 1:
-                tick_labels.append(r"$\frac{\pi}{2}$")
-            elif n == 2:
-                tick_labels.append(r"$\pi$")
-            else:
-                tick_labels.append(rf"${n}\frac{{\pi}}{{2}}$")
+        x_max_original = _TWO_PI / psi
+        N = int(math.ceil(x_max_original / _HALF_PI))
+        max_tick = N * _HALF_PI
+
+        # Generate x range and compute Pa/Pb. Single precision is plenty for a
+        # plot; psi is cast so NumPy does not promote the result to float64
+        if x_points is None:
+            x_range, pb_values = self._adaptive_grid(np.float32(psi), max_tick, max_points=_DEFAULT_POINTS)
+        else:
+            x_range = np.linspace(0, max_tick, x_points, dtype=np.float32)
+            pb_values = self._couple_state(x_range, np.float32(psi))[1]
+        np.multiply(pb_values, F_value, out=pb_values)
+        pa_values = np.subtract(1.0, pb_values)
+        return kappa, psi, l_c, N, x_range, pa_values, pb_values
+
+    def _adaptive_grid(self, psi, max_tick, tol=2.5e-3, max_points=100, seed_points=24):
+        """
+        Samples sin^2(psi*z) on [0, max_tick], placing points where the curve
+        bends (around the peaks and troughs) rather than uniformly.
 
-        ax.set_xticks(tick_positions)
-        ax.set_xticklabels(tick_labels, fontsize=10)
+        Starting from seed_points uniform points (no more than max_points),
+        every interval is split at its midpoint while the curve there is more
+        than tol away from the straight segment drawn between the interval
+        ends, until max_points is reached. The default tol is below a pixel at
+        the size of the plot_F_graphs figure.
 
-        # Tight layout, reserving space at the bottom for additional info
-        fig.tight_layout(rect=(0, 0.3, 1, 0.95))
+        Args:
+            psi (float): The psi parameter.
+            max_tick (float): The end of the z range.
+            tol (float, optional): Allowed deviation of the drawn segments. Defaults to 2.5e-3.
+            max_points (int, optional): Maximum number of points. Defaults to 100.
+            seed_points (int, optional): Number of initial uniform points. Defaults to 24.
 
-        # Place a bold 'Parameters' title below the main plot
-        fig.text(0.5, 0.2, "Parameters", ha="center", va="bottom", fontsize=12, fontweight="bold")
+        Returns:
+            tuple: (z, sin^2(psi*z)) arrays, with z increasing.
+        """
+        seed_points = min(seed_points, max_points)
+        z = np.linspace(0, max_tick, seed_points, dtype=np.float32)
+        s2 = self._couple_state(z, psi)[1]
+        active = np.arange(seed_points - 1)  # intervals [i, i + 1] still to check
+
+        while active.size and len(z) < max_points:
+            mid = (z[active] + z[active + 1]) * np.float32(0.5)
+            s2_mid = self._couple_state(mid, psi)[1]
+            error = np.abs(s2_mid - (s2[active] + s2[active + 1]) * 0.5)
+
+            split = np.flatnonzero(error > tol)
+            room = max_points - len(z)
+            if split.size > room:
+                # Out of points: keep the worst intervals, in order
+                split = np.sort(split[np.argsort(error[split])[::-1][:room]])
+            idx = active[split]
+
+            z = np.insert(z, idx + 1, mid[split])
+            s2 = np.insert(s2, idx + 1, s2_mid[split])
+            # Both halves of every split interval are checked next
+            left = idx + np.arange(idx.size)
+            active = np.sort(np.concatenate((left, left + 1)))
+
+        return z, s2
+
+    def _info_for(self, kappa, psi, l_c):
+        """
+        Builds the parameter text shown below the plot.
 
-        # Additional info text using LaTeX formatting
-        additional_info = (
-            r"$n_{eff_1} = " + f"{self.n_eff1}" +
-            r",\quad n_{eff_2} = " + f"{self.n_eff2}" +
-            r",\quad \lambda = " + f"{self.lambd}" + r"$" + "\n" + r"$" +
-            r"\quad \beta_1 = " + f"{self.beta1:.2f}" +
-            r",\quad \beta_2 = " + f"{self.beta2:.2f}" +
-            r",\quad \delta = " + f"{self.delta:.2f}" + r"$" + "\n" + r"$" +
+        Args:
+            kappa (float): The kappa parameter.
+            psi (float): The psi parameter.
+            l_c (float): The coupling length.
+
+        Returns:
+            str: The LaTeX-formatted parameter text.
+        """
+        # Only the F-dependent line is formatted here, the rest is the
+        # instance's _param_prefix
+        return (
+            self._param_prefix + r"$" +
             r"\quad \kappa = " + f"{kappa:.2f}" +
             r",\quad \psi = " + f"{psi:.2f}" +
             r",\quad L_c = " + f"{l_c:.2f}" + r"$"
         )
 
-        # Place the additional info text below the 'Parameters' title
-        fig.text(0.5, 0.05, additional_info, ha="center", va="bottom", fontsize=10)
+    def _draw_animated(self):
+        """
+        Draws the F-dependent artists of the cached figure.
+        """
+        for artist in (self._pa_line, self._pb_line, self._ax.title, self._info_text):
+            self._fig.draw_artist(artist)
+
+    def _on_draw(self, event):
+        """
+        Captures the static background after every full draw of the figure
+        on screen, then draws the F-dependent artists on top of it.
+
+        savefig also emits draw events, from a temporary canvas for other
+        formats (which cannot copy regions) or from the screen canvas at the
+        save dpi; those are ignored, and savefig draws the animated artists
+        itself.
+
+        Args:
+            event (matplotlib.backend_bases.DrawEvent): The draw event.
+        """
+        if event.canvas is not self._canvas or event.canvas.is_saving():
+            return
+        self._bg = event.canvas.copy_from_bbox(self._fig.bbox)
+        self._draw_animated()
+
+    def _plot_multi_F(self, F_values, x_points=None):
+        """
+        Generates a figure with one Pa(z)/Pb(z) subplot per F value, stacked
+        vertically. Unlike the single F plot, the figure is not reused.
 
+        Args:
+            F_values (array-like): The F values to plot.
+            x_points (int, optional): Number of points for the x-axis. Defaults to 100.
+
+        Returns:
+            matplotlib.figure.Figure: The generated figure.
+        """
+        if x_points is None:
+            x_points = _DEFAULT_POINTS
+        F_values = np.ravel(F_values)
+
+        # All F values at once: one row per F, each with its own z range
+        # running up to N*pi/2
+        F = F_values[:, None]
+        psi = self.get_psi(self.get_kappa(F))
+        Ns = np.ceil((_TWO_PI / psi) / _HALF_PI).astype(int)
+        x_ranges = (Ns * _HALF_PI).astype(np.float32) * np.linspace(0, 1, x_points, dtype=np.float32)
+        pa, pb = self._compute_pa_pb(x_ranges, psi.astype(np.float32), F.astype(np.float32))
+
+        import matplotlib.pyplot as plt
+
+        fig, axs = plt.subplots(len(F_values), 1, figsize=(7, 3 * len(F_values)), squeeze=False)
+
+        for ax, F, N, x_range, pa_values, pb_values in zip(axs[:, 0], F_values, Ns[:, 0], x_ranges, pa, pb):
+            ax.plot(x_range, pa_values, label=r"$P_a(z)$", color="royalblue", linewidth=2)
+            ax.plot(x_range, pb_values, label=r"$P_b(z)$", color="crimson", linewidth=2)
+            ax.set_xlabel("z", fontsize=11)
+            ax.set_title(rf"$F = {F}$", fontsize=13)
+            ax.legend(fontsize=10)
+            ax.grid(True, linestyle=":", color="gray", alpha=0.3)
+            self._set_ticks(ax, N)
+
+        fig.tight_layout()
         return fig
 
+    def _ticks_for(self, N):
+        """
+        Returns the x-tick positions and labels for N increments of pi/2,
+        building them only the first time each N is seen.
+
+        Args:
+            N (int): Number of pi/2 increments on the x-axis.
+
+        Returns:
+            tuple: (positions, labels) for the ticks 0, pi/2, ..., N*pi/2.
+        """
+        if N not in self._tick_cache:
+            positions = np.arange(N + 1) * _HALF_PI
+            labels = ["0", r"$\frac{\pi}{2}$", r"$\pi$"] + [rf"${n}\frac{{\pi}}{{2}}$" for n in range(3, N + 1)]
+            self._tick_cache[N] = (positions, labels[:N + 1])
+        return self._tick_cache[N]
+
+    def _set_ticks(self, ax, N):
+        """
+        Sets the x-ticks at increments of pi/2, from 0 to N*pi/2.
+
+        Args:
+            ax (matplotlib.axes.Axes): The axes of the plot.
+            N (int): Number of pi/2 increments on the x-axis.
+        """
+        tick_positions, tick_labels = self._ticks_for(N)
+        ax.set_xticks(tick_positions)
+        ax.set_xticklabels(tick_labels, fontsize=10)
+
+    def _discard_figure(self, event):
+        """
+        Forgets the cached figure once its window has been closed.
+
+        Args:
+            event (matplotlib.backend_bases.CloseEvent): The close event.
+        """
+        self._fig = None
+        self._canvas = None
+        self._bg = None
+
 
 # --------------------------
 # Example usage:
 # --------------------------
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
     # Create an instance with effective indices and wavelength.
     f_results = FGraphicResults(n_eff1=1.45, n_eff2=1.29, lambd=1)
     # Generate the plot for F values 0.2 and 0.5.
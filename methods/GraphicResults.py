@@ -3,8 +3,8 @@ methods.GraphicResults Module
 
 This module defines the `GraphicResults` class, which computes and plots the 
 electric and magnetic field distributions for TE and TM modes in a planar 
-waveguide. It leverages a numerical method (`metodo_ondulatorio`) to find 
-angular solutions, then uses helper functions from `field_functions.py` 
+waveguide. It leverages a numerical method (`angulo_ondulatorio`) to find 
+the angular solution of each plotted mode, then uses helper functions from `field_functions.py` 
 to generate field profiles for E and H.
 
 Usage:
@@ -24,14 +24,18 @@ Example:
 """
 
 
-import matplotlib.pyplot as plt
-import matplotlib
 import math
 import numpy as np
 import methods.field_functions as ff
-from methods.metodo_ondulatorio import metodo_ondulatorio
+from methods.metodo_ondulatorio import angulo_ondulatorio
 
-matplotlib.use('qtagg')
+# Field function getters and axis labels for each (mode, parity)
+_FIELD_TABLE = {
+    ("TE", "even"): (ff.get_E_y_even, ff.get_H_z_even, r"$\varepsilon_y(x)$", r"$H_z(x)$"),
+    ("TE", "odd"):  (ff.get_E_y_odd,  ff.get_H_z_odd,  r"$\varepsilon_y(x)$", r"$H_z(x)$"),
+    ("TM", "even"): (ff.get_E_z_even, ff.get_H_y_even, r"$\varepsilon_z(x)$", r"$H_y(x)$"),
+    ("TM", "odd"):  (ff.get_E_z_odd,  ff.get_H_y_odd,  r"$\varepsilon_z(x)$", r"$H_y(x)$"),
+}
 
 class GraphicResults:
     """
@@ -43,9 +47,11 @@ class GraphicResults:
         n_cl (float): Cladding refractive index.
         h (float): Waveguide height.
         lambd (float): Wavelength.
+        ms (tuple): The mode indices that can be plotted.
         solution (dict): A dictionary of solutions for TE/TM modes 
                          (keys are "TE" and "TM"), each containing
                          angle values for the specified mode indices.
+                         Computed on first access.
     """
 
     def __init__(self, n_co, n_cl, h, lambd, ms=range(3)):
@@ -63,14 +69,44 @@ class GraphicResults:
         self.n_cl = n_cl
         self.h = h
         self.lambd = lambd
-        # Precompute mode solutions (assumed to return a dict with keys "TE" and "TM")
-        self.solution = metodo_ondulatorio(
-            n_co=self.n_co, 
-            n_cl=self.n_cl,
-            h=self.h,
-            lambd=self.lambd,
-            ms=ms
-        )
+        # Constants of get_kappa / get_gamma, fixed for the instance
+        self._k0 = 2 * math.pi / lambd
+        self._n_ratio_sq = (n_cl / n_co) ** 2
+        self.ms = tuple(ms)
+        # (mode, m) -> theta in degrees, each mode solved the first time it is plotted
+        self._thetas = {}
+
+    @property
+    def solution(self):
+        """
+        dict: The angles of every mode in ms, as {"TE": {m: theta}, "TM": {m: theta}}.
+        """
+        return {mode: {m: self.get_theta(mode, m) for m in self.ms} for mode in ("TE", "TM")}
+
+    def get_theta(self, mode, m):
+        """
+        Returns the incidence angle of one mode, solving only that mode the
+        first time it is requested.
+
+        Args:
+            mode (str): "TE" or "TM".
+            m (int): Mode index, one of ms.
+
+        Returns:
+            float: The angle theta in degrees.
+
+        Raises:
+            KeyError: If m is not one of the mode indices of the instance.
+            ValueError: If the mode is not "TE" or "TM", or it has no solution.
+        """
+        key = (mode, m)
+        theta = self._thetas.get(key)
+        if theta is None:
+            if m not in self.ms:
+                raise KeyError(m)
+            theta = angulo_ondulatorio(self.n_co, self.n_cl, self.h, self.lambd, m, mode)
+            self._thetas[key] = theta
+        return theta
 
     def get_kappa(self, theta):
         """
@@ -86,8 +122,7 @@ class GraphicResults:
         Returns:
             float: The computed kappa value.
         """
-        k0 = 2 * math.pi / self.lambd
-        return k0 * self.n_co * math.cos(math.radians(theta))
+        return self._k0 * self.n_co * math.cos(math.radians(theta))
 
     def get_gamma(self, kappa, mode, parity):
         """
@@ -109,43 +144,48 @@ class GraphicResults:
         Returns:
             float: The computed gamma value.
         """
-        h = self.h
         mode = mode.upper()
+        # tan(arg) = s / c, computed once for whichever branch applies
+        arg = kappa * self.h / 2
+        c = math.cos(arg)
+        s = math.sin(arg)
         if mode == 'TE':
             if parity == 'even':
-                return kappa * math.tan(kappa * h / 2)
+                return kappa * s / c
             elif parity == 'odd':
-                return -kappa / math.tan(kappa * h / 2)
+                return -kappa * c / s
         elif mode == 'TM':
             if parity == 'even':
-                return ((self.n_cl / self.n_co)**2) * kappa * math.tan(kappa * h / 2)
+                return self._n_ratio_sq * kappa * s / c
             elif parity == 'odd':
-                return -((self.n_cl / self.n_co)**2) * kappa / math.tan(kappa * h / 2)
+                return -self._n_ratio_sq * kappa * c / s
 
-    def plot_fields(self, mode, m, parity=None, x_range=None):
+    def _fields_for(self, mode, m, parity=None):
         """
-        Generates and returns a matplotlib figure with two subplots:
-          - Left: Electric field (E)
-          - Right: Magnetic field (H)
-        
+        Selects the E and H field functions of one mode from field_functions.py.
+
         Args:
             mode (str): "TE" or "TM".
             m (int): Mode index.
             parity (str, optional): "even" or "odd". Defaults to even if m is even, odd otherwise.
-            x_range (array-like, optional): Range of x values to plot. 
-                                            Defaults to [-2h, 2h] if None.
 
         Returns:
-            matplotlib.figure.Figure: The generated figure containing two subplots.
-        
+            tuple: (E_func, H_func, kappa, parity, (E label, H label)).
+
         Raises:
-            ValueError: If the solution for the given mode and m is not found.
+            ValueError: If the solution for the given mode and m is not found,
+                        or the parity is not "even" or "odd".
         """
         if parity is None:
             parity = "even" if m % 2 == 0 else "odd"
         mode = mode.upper()
+        parity = parity.lower()
         try:
-            theta = self.solution[mode][m]
+            E_getter, H_getter, first_label, second_label = _FIELD_TABLE[(mode, parity)]
+        except KeyError:
+            raise ValueError(f"Unknown mode/parity: {mode}, {parity}")
+        try:
+            theta = self.get_theta(mode, m)
         except Exception as e:
             raise ValueError(f"Solution for mode {mode} with m={m} not found: {e}")
         
@@ -153,33 +193,65 @@ class GraphicResults:
         kappa_val = self.get_kappa(theta)
         gamma_val = self.get_gamma(kappa_val, mode, parity)
 
-        # Select appropriate field functions from field_functions.py
-        if mode == "TE":
-            first_label = r"$\varepsilon_y(x)$"
-            second_label = r"$H_z(x)$"
-            if parity.lower() == "even":
-                E_func = ff.get_E_y_even(self.h, gamma_val, kappa_val)
-                H_func = ff.get_H_z_even(self.h, gamma_val, kappa_val)
-            else:
-                E_func = ff.get_E_y_odd(self.h, gamma_val, kappa_val)
-                H_func = ff.get_H_z_odd(self.h, gamma_val, kappa_val)
-        else:  # TM
-            first_label = r"$\varepsilon_z(x)$"
-            second_label = r"$H_y(x)$"
-            if parity.lower() == "even":
-                E_func = ff.get_E_z_even(self.h, gamma_val, kappa_val)
-                H_func = ff.get_H_y_even(self.h, gamma_val, kappa_val)
-            else:
-                E_func = ff.get_E_z_odd(self.h, gamma_val, kappa_val)
-                H_func = ff.get_H_y_odd(self.h, gamma_val, kappa_val)
+        # Field functions from field_functions.py
+        E_func = E_getter(self.h, gamma_val, kappa_val)
+        H_func = H_getter(self.h, gamma_val, kappa_val)
+
+        return E_func, H_func, kappa_val, parity, (first_label, second_label)
+
+    def _default_x_range(self, kappa):
+        """
+        Returns the default x values of the field plots: [-2h, 2h] with enough
+        points for the oscillations of higher modes, ~40 per period of
+        cos/sin(kappa x) over the 4h span and never fewer than 100.
+
+        Args:
+            kappa (float): The largest kappa among the plotted modes.
+
+        Returns:
+            numpy.ndarray: The x values, in single precision (plenty for a plot).
+        """
+        periods = kappa * (4 * self.h) / (2 * math.pi)
+        x_points = int(max(100, 40 * periods))
+        return np.linspace(-2 * self.h, 2 * self.h, x_points, dtype=np.float32)
+
+    def plot_fields(self, mode, m, parity=None, x_range=None):
+        """
+        Generates and returns a matplotlib figure with two subplots:
+          - Left: Electric field (E)
+          - Right: Magnetic field (H)
+        
+        Args:
+            mode (str): "TE" or "TM".
+            m (int): Mode index.
+            parity (str, optional): "even" or "odd". Defaults to even if m is even, odd otherwise.
+            x_range (array-like, optional): Range of x values to plot. 
+                                            Defaults to [-2h, 2h] if None, with at least
+                                            40 points per oscillation of the mode.
+
+        Returns:
+            matplotlib.figure.Figure: The generated figure containing two subplots.
+        
+        Raises:
+            ValueError: If the solution for the given mode and m is not found.
+        """
+        E_func, H_func, kappa_val, parity, (first_label, second_label) = self._fields_for(mode, m, parity)
+        mode = mode.upper()
 
         # Default x-range if not provided
         if x_range is None:
-            x_range = np.linspace(-2 * self.h, 2 * self.h, 100)
+            x_range = self._default_x_range(kappa_val)
+        x_range = np.ascontiguousarray(x_range)
 
-        # Evaluate E and H field profiles
-        E_vals = [E_func(x) for x in x_range]
-        H_vals = [H_func(x) for x in x_range]
+        # Evaluate E and H field profiles over the whole range at once, as
+        # contiguous float arrays matplotlib can use without copying
+        E_vals = np.ascontiguousarray(E_func(x_range))
+        H_vals = np.ascontiguousarray(H_func(x_range))
+        assert E_vals.dtype.kind == H_vals.dtype.kind == "f" and E_vals.shape == x_range.shape
+
+        # pyplot is only needed to plot; importing it lazily keeps the
+        # solver usable without loading matplotlib
+        import matplotlib.pyplot as plt
 
         # Create subplots
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
@@ -201,6 +273,64 @@ class GraphicResults:
         fig.tight_layout()
         return fig
 
+    def plot_fields_batch(self, mode, ms, x_range=None):
+        """
+        Generates a single figure with the E and H fields of several modes of
+        the same type, one curve per mode in each subplot. Each mode uses its
+        default parity (even for even m, odd otherwise).
+
+        Args:
+            mode (str): "TE" or "TM".
+            ms (iterable): Mode indices to plot.
+            x_range (array-like, optional): Range of x values to plot, shared by
+                                            all modes. Defaults to [-2h, 2h] if None,
+                                            sampled for the fastest oscillating mode.
+
+        Returns:
+            matplotlib.figure.Figure: The generated figure containing two subplots.
+
+        Raises:
+            ValueError: If the solution for the given mode and some m is not found.
+        """
+        mode = mode.upper()
+        ms = list(ms)
+        fields = [self._fields_for(mode, m) for m in ms]
+        first_label, second_label = fields[0][4]
+
+        if x_range is None:
+            x_range = self._default_x_range(max(kappa for _, _, kappa, _, _ in fields))
+        x_range = np.ascontiguousarray(x_range)
+
+        # One row per mode, so each subplot takes all of them in one plot call;
+        # the field functions write each row in place
+        E_matrix = np.empty((len(ms), x_range.size), dtype=np.result_type(x_range, np.float32))
+        H_matrix = np.empty_like(E_matrix)
+        for row, (E_func, H_func, _, _, _) in enumerate(fields):
+            E_func(x_range, out=E_matrix[row])
+            H_func(x_range, out=H_matrix[row])
+
+        import matplotlib.pyplot as plt
+
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+        labels = [f"m={m}" for m in ms]
+
+        ax1.plot(x_range, E_matrix.T, linewidth=2, label=labels)
+        ax1.set_xlabel("x", fontsize=12)
+        ax1.set_ylabel(first_label, fontsize=12)
+        ax1.set_title(f"{mode} modes E-field", fontsize=14)
+        ax1.grid(True, linestyle=":", color="gray", alpha=0.3)
+        ax1.legend(fontsize=10)
+
+        ax2.plot(x_range, H_matrix.T, linewidth=2, label=labels)
+        ax2.set_xlabel("x", fontsize=12)
+        ax2.set_ylabel(second_label, fontsize=12)
+        ax2.set_title(f"{mode} modes H-field", fontsize=14)
+        ax2.grid(True, linestyle=":", color="gray", alpha=0.3)
+        ax2.legend(fontsize=10)
+
+        fig.tight_layout()
+        return fig
+
 
 # ---------------------------
 # Example usage:
@@ -2,9 +2,10 @@
 methods.field_functions Module
 
 This module provides a set of functions for calculating TE and TM field profiles 
-(even and odd) in a planar waveguide. Each function returns a lambda that computes 
-the field value at a given x position, based on parameters like the waveguide height (h), 
-the propagation constants (kappa, gamma), and the chosen parity (even or odd).
+(even and odd) in a planar waveguide. Each function returns a function that computes 
+the field value at a given x position, or over a NumPy array of positions at once, 
+based on parameters like the waveguide height (h), the propagation constants 
+(kappa, gamma), and the chosen parity (even or odd).
 
 Usage:
     from field_functions import (
@@ -15,14 +16,136 @@ Usage:
     # Example for TE field (even):
     E_y = get_E_y_even(h, gamma, kappa)
     field_value_at_x = E_y(x)
+    field_values = E_y(np.linspace(-2 * h, 2 * h, 100))
+    E_y(x_values, out=buffer)  # writes into a preallocated array instead
 """
 
+import functools
 import math
+import numpy as np
+
+
+def _as_float_array(x):
+    """
+    Returns x as a floating NumPy array, keeping float32/float64 inputs as is.
+    """
+    x = np.asarray(x)
+    if not np.issubdtype(x.dtype, np.floating):
+        x = x.astype(np.float64)
+    return x
+
+
+# Above this gamma*h/2, exp(gamma*h/2) gets too close to the float32 range
+# to be folded into the amplitude (see _decay)
+_MAX_FOLDED_W = 40.0
+
+
+def _decay(abs_x, half, gamma):
+    """
+    Overwrites abs_x, the |x| values, with exp(-gamma |x|) up to a constant
+    factor, and returns the factor that turns them into exp(-gamma (|x| - h/2)).
+
+    Args:
+        abs_x (numpy.ndarray): The |x| values, overwritten in place.
+        half (float): Half the waveguide height.
+        gamma (float): The decay constant outside the core.
+
+    Returns:
+        float: The factor to apply to abs_x afterwards.
+    """
+    W = gamma * half
+    if W <= _MAX_FOLDED_W:
+        # exp(-gamma (|x| - h/2)) = exp(gamma h/2) * exp(-gamma |x|): the
+        # shift goes into the returned factor, one pass less per point
+        np.multiply(abs_x, -gamma, out=abs_x)
+        np.exp(abs_x, out=abs_x)
+        return math.exp(W)
+    # Very confined modes: keep the shift so nothing overflows, clamping the
+    # core points (overwritten by the caller) to the boundary as well
+    np.maximum(abs_x, half, out=abs_x)
+    np.subtract(abs_x, half, out=abs_x)
+    np.multiply(abs_x, -gamma, out=abs_x)
+    np.exp(abs_x, out=abs_x)
+    return 1.0
+
+
+def _cos_profile(x, h, gamma, kappa, inside, outside, out=None):
+    """
+    Evaluates a profile that is inside * cos(kappa x) in the core and
+    outside * exp(-gamma (|x| - h/2)) on both sides of it (symmetric in x).
+    Every pass runs in place on a single output buffer.
+
+    Args:
+        x (float or array-like): Position(s) where the field is evaluated.
+        h (float): The waveguide height.
+        gamma (float): The decay constant outside the core.
+        kappa (float): The transverse wavenumber inside the core.
+        inside (float): Amplitude inside the core.
+        outside (float): Amplitude at the core boundary, outside.
+        out (numpy.ndarray, optional): Float array with the shape of x to write
+                                       the values into. Allocated if None.
+
+    Returns:
+        numpy.ndarray or numpy.floating: The field values, with the shape of x
+        (a scalar if x is a scalar).
+    """
+    x = _as_float_array(x)
+    if out is None:
+        out = np.empty_like(x)
+    # |x| is taken once; its buffer becomes the outside branch, then the
+    # core points are overwritten through the mask
+    half = h / 2
+    np.abs(x, out=out)
+    core = out <= half
+    scale = _decay(out, half, gamma)
+    np.multiply(out, outside * scale, out=out)
+    np.multiply(x, kappa, out=out, where=core)
+    np.cos(out, out=out, where=core)
+    np.multiply(out, inside, out=out, where=core)
+    # [()] unwraps a 0-d result into a scalar, as a ufunc would
+    return out if out.ndim else out[()]
+
+
+def _sin_profile(x, h, gamma, kappa, inside, outside, out=None):
+    """
+    Evaluates a profile that is inside * sin(kappa x) in the core and
+    sign(x) * outside * exp(-gamma (|x| - h/2)) outside it (antisymmetric in x).
+    Every pass runs in place on a single output buffer.
+
+    Args:
+        x (float or array-like): Position(s) where the field is evaluated.
+        h (float): The waveguide height.
+        gamma (float): The decay constant outside the core.
+        kappa (float): The transverse wavenumber inside the core.
+        inside (float): Amplitude inside the core.
+        outside (float): Amplitude at the core boundary, for x > h/2.
+        out (numpy.ndarray, optional): Float array with the shape of x to write
+                                       the values into. Allocated if None.
+
+    Returns:
+        numpy.ndarray or numpy.floating: The field values, with the shape of x
+        (a scalar if x is a scalar).
+    """
+    x = _as_float_array(x)
+    if out is None:
+        out = np.empty_like(x)
+    half = h / 2
+    np.abs(x, out=out)
+    core = out <= half
+    scale = _decay(out, half, gamma)
+    # The exponential is positive, so copysign gives it the sign of x
+    np.copysign(out, x, out=out)
+    np.multiply(out, outside * scale, out=out)
+    np.multiply(x, kappa, out=out, where=core)
+    np.sin(out, out=out, where=core)
+    np.multiply(out, inside, out=out, where=core)
+    return out if out.ndim else out[()]
+
 
 # TE field functions
 def get_E_y_even(h, gamma, kappa):
     """
-    Returns a lambda function representing the even TE electric field profile (E_y).
+    Returns a function representing the even TE electric field profile (E_y).
 
     Args:
         h (float): The waveguide height.
@@ -30,19 +153,15 @@ def get_E_y_even(h, gamma, kappa):
         kappa (float): A computed propagation constant factor (for TE).
 
     Returns:
-        function: A lambda taking x as input and returning E_y(x) for the even TE mode.
+        function: A function taking x (float or array) as input and returning E_y(x) for the even TE mode.
     """
     C_0 = math.cos(kappa * h / 2)
     C_1 = 1
-    print("C0 Ey even", C_0)
-    print("C1 Ey even", C_1)
-    outside_function = lambda x: C_0 * math.exp(-gamma * (abs(x) - h / 2))
-    inside_function = lambda x: C_1 * math.cos(kappa * x)
-    return lambda x: inside_function(x) if abs(x) <= h / 2 else outside_function(x)
+    return functools.partial(_cos_profile, h=h, gamma=gamma, kappa=kappa, inside=C_1, outside=C_0)
 
 def get_H_z_even(h, gamma, kappa):
     """
-    Returns a lambda function representing the even TE magnetic field profile (H_z).
+    Returns a function representing the even TE magnetic field profile (H_z).
 
     Args:
         h (float): The waveguide height.
@@ -50,20 +169,15 @@ def get_H_z_even(h, gamma, kappa):
         kappa (float): A computed propagation constant factor (for TE).
 
     Returns:
-        function: A lambda taking x as input and returning H_z(x) for the even TE mode.
+        function: A function taking x (float or array) as input and returning H_z(x) for the even TE mode.
     """
     C_0 = (kappa / gamma) * math.sin(kappa * h / 2)
     C_1 = 1
-    print("C0 Hz even", C_0)
-    print("C1 Hz even", C_1)
-    left_function = lambda x: gamma * C_0 * math.exp(-gamma * (abs(x) - h / 2))
-    center_function = lambda x: -kappa * C_1 * math.sin(kappa * x)
-    right_function = lambda x: -gamma * C_0 * math.exp(-gamma * (abs(x) - h / 2))
-    return lambda x: left_function(x) if x < -h/2 else center_function(x) if abs(x) <= h/2 else right_function(x)
+    return functools.partial(_sin_profile, h=h, gamma=gamma, kappa=kappa, inside=-kappa * C_1, outside=-gamma * C_0)
 
 def get_E_y_odd(h, gamma, kappa):
     """
-    Returns a lambda function representing the odd TE electric field profile (E_y).
+    Returns a function representing the odd TE electric field profile (E_y).
 
     Args:
         h (float): The waveguide height.
@@ -71,20 +185,15 @@ def get_E_y_odd(h, gamma, kappa):
         kappa (float): A computed propagation constant factor (for TE).
 
     Returns:
-        function: A lambda taking x as input and returning E_y(x) for the odd TE mode.
+        function: A function taking x (float or array) as input and returning E_y(x) for the odd TE mode.
     """
     C_0 = math.sin(kappa * h / 2)
     C_1 = 1
-    print("C0 Ey odd", C_0)
-    print("C1 Ey odd", C_1)
-    left_function = lambda x: -C_0 * math.exp(gamma * (x + h / 2))
-    center_function = lambda x: C_1 * math.sin(kappa * x)
-    right_function = lambda x: C_0 * math.exp(-gamma * (x - h / 2))
-    return lambda x: left_function(x) if x < -h/2 else center_function(x) if abs(x) <= h/2 else right_function(x)
+    return functools.partial(_sin_profile, h=h, gamma=gamma, kappa=kappa, inside=C_1, outside=C_0)
 
 def get_H_z_odd(h, gamma, kappa):
     """
-    Returns a lambda function representing the odd TE magnetic field profile (H_z).
+    Returns a function representing the odd TE magnetic field profile (H_z).
 
     Args:
         h (float): The waveguide height.
@@ -92,21 +201,16 @@ def get_H_z_odd(h, gamma, kappa):
         kappa (float): A computed propagation constant factor (for TE).
 
     Returns:
-        function: A lambda taking x as input and returning H_z(x) for the odd TE mode.
+        function: A function taking x (float or array) as input and returning H_z(x) for the odd TE mode.
     """
     C_0 = -(kappa / gamma) * math.cos(kappa * h / 2)
     C_1 = 1
-    print("C0 Hz odd", C_0)
-    print("C1 Hz odd", C_1)
-    left_function = lambda x: -C_0 * gamma * math.exp(gamma*(x + h/2))
-    center_function = lambda x: C_1 * kappa * math.cos(kappa * x)
-    right_function = lambda x: -C_0 * gamma * math.exp(-gamma*(x - h/2))
-    return lambda x: left_function(x) if x < -h/2 else center_function(x) if abs(x) <= h/2 else right_function(x)
+    return functools.partial(_cos_profile, h=h, gamma=gamma, kappa=kappa, inside=kappa * C_1, outside=-gamma * C_0)
 
 # TM field functions
 def get_H_y_even(h, gamma, kappa):
     """
-    Returns a lambda function representing the even TM magnetic field profile (H_y).
+    Returns a function representing the even TM magnetic field profile (H_y).
 
     Args:
         h (float): The waveguide height.
@@ -114,19 +218,15 @@ def get_H_y_even(h, gamma, kappa):
         kappa (float): A computed propagation constant factor (for TM).
 
     Returns:
-        function: A lambda taking x as input and returning H_y(x) for the even TM mode.
+        function: A function taking x (float or array) as input and returning H_y(x) for the even TM mode.
     """
     C_0 = math.cos(kappa * h / 2)
     C_1 = 1
-    print("C0 Hy even", C_0)
-    print("C1 Hy even", C_1)
-    outside_function = lambda x: C_0 * math.exp(-gamma * (abs(x) - h / 2))
-    inside_function = lambda x: C_1 * math.cos(kappa * x)
-    return lambda x: inside_function(x) if abs(x) <= h / 2 else outside_function(x)
+    return functools.partial(_cos_profile, h=h, gamma=gamma, kappa=kappa, inside=C_1, outside=C_0)
 
 def get_E_z_even(h, gamma, kappa):
     """
-    Returns a lambda function representing the even TM electric field profile (E_z).
+    Returns a function representing the even TM electric field profile (E_z).
 
     Args:
         h (float): The waveguide height.
@@ -134,20 +234,15 @@ def get_E_z_even(h, gamma, kappa):
         kappa (float): A computed propagation constant factor (for TM).
 
     Returns:
-        function: A lambda taking x as input and returning E_z(x) for the even TM mode.
+        function: A function taking x (float or array) as input and returning E_z(x) for the even TM mode.
     """
     C_0 = (kappa / gamma) * math.sin(kappa * h / 2)
     C_1 = 1
-    print("C0 Ez even", C_0)
-    print("C1 Ez even", C_1)
-    left_function = lambda x: gamma * C_0 * math.exp(-gamma * (abs(x) - h / 2))
-    center_function = lambda x: -kappa * C_1 * math.sin(kappa * x)
-    right_function = lambda x: -gamma * C_0 * math.exp(-gamma * (abs(x) - h / 2))
-    return lambda x: left_function(x) if x < -h/2 else center_function(x) if abs(x) <= h/2 else right_function(x)
+    return functools.partial(_sin_profile, h=h, gamma=gamma, kappa=kappa, inside=-kappa * C_1, outside=-gamma * C_0)
 
 def get_H_y_odd(h, gamma, kappa):
     """
-    Returns a lambda function representing the odd TM magnetic field profile (H_y).
+    Returns a function representing the odd TM magnetic field profile (H_y).
 
     Args:
         h (float): The waveguide height.
@@ -155,20 +250,15 @@ def get_H_y_odd(h, gamma, kappa):
         kappa (float): A computed propagation constant factor (for TM).
 
     Returns:
-        function: A lambda taking x as input and returning H_y(x) for the odd TM mode.
+        function: A function taking x (float or array) as input and returning H_y(x) for the odd TM mode.
     """
     C_0 = math.sin(kappa * h / 2)
     C_1 = 1
-    print("C0 Hy odd", C_0)
-    print("C1 Hy odd", C_1)
-    left_function = lambda x: -C_0 * math.exp(gamma * (x + h / 2))
-    center_function = lambda x: C_1 * math.sin(kappa * x)
-    right_function = lambda x: C_0 * math.exp(-gamma * (x - h / 2))
-    return lambda x: left_function(x) if x < -h/2 else center_function(x) if abs(x) <= h/2 else right_function(x)
+    return functools.partial(_sin_profile, h=h, gamma=gamma, kappa=kappa, inside=C_1, outside=C_0)
 
 def get_E_z_odd(h, gamma, kappa):
     """
-    Returns a lambda function representing the odd TM electric field profile (E_z).
+    Returns a function representing the odd TM electric field profile (E_z).
 
     Args:
         h (float): The waveguide height.
@@ -176,13 +266,8 @@ def get_E_z_odd(h, gamma, kappa):
         kappa (float): A computed propagation constant factor (for TM).
 
     Returns:
-        function: A lambda taking x as input and returning E_z(x) for the odd TM mode.
+        function: A function taking x (float or array) as input and returning E_z(x) for the odd TM mode.
     """
     C_0 = -(kappa / gamma) * math.cos(kappa * h / 2)
     C_1 = 1
-    print("C0 Ez odd", C_0)
-    print("C1 Ez odd", C_1)
-    left_function = lambda x: -gamma * C_0 * math.exp(gamma * (x + h / 2))
-    center_function = lambda x: kappa * C_1 * math.cos(kappa * x)
-    right_function = lambda x: -gamma * C_0 * math.exp(-gamma * (x - h / 2))
-    return lambda x: left_function(x) if x < -h/2 else center_function(x) if abs(x) <= h/2 else right_function(x)
+    return functools.partial(_cos_profile, h=h, gamma=gamma, kappa=kappa, inside=kappa * C_1, outside=-gamma * C_0)
@@ -4,10 +4,11 @@ methods.metodo_ondulatorio Module
 This module provides functions for analyzing waveguide modes using the 
 "ondulatorio" (wave-based) approach. It computes the valid angles of incidence 
 (θ) for both TE and TM modes in a planar waveguide, relying on a transcendental 
-equation for U that is solved numerically using bisection. The key functions are:
+equation for U that is solved numerically with Brent's method. The key functions are:
 
 - get_W:          Generates a function W(U) based on mode index (m) and mode type (TE/TM).
 - funcion_ondulatoria: Returns a function whose roots give valid U values for propagation.
+- angulo_ondulatorio:  Finds the permissible angle of a single mode (m, TE or TM).
 - metodo_ondulatorio:  Uses these functions to find permissible angles for TE and TM modes.
 
 Example:
@@ -16,7 +17,7 @@ Example:
     print(results)  # {'TE': {0: theta_0, 1: theta_1, ...}, 'TM': {...}}
 """
 
-import matplotlib.pyplot as plt
+import functools
 import scipy.optimize
 import numpy as np
 import math
@@ -69,33 +70,81 @@ def funcion_ondulatoria(n_co, n_cl, h, lambd, m, modo):
         modo (str): Tipo de modo de propagación, puede ser "TE" (Transverse Electric) o "TM" (Transverse Magnetic).
 
     Returns:
-        function: Función lambda donde sus raices son los valores permitidos para U
+        function: Función donde sus raices son los valores permitidos para U
 
     Raises:
         ValueError: Si el modo no es "TE" o "TM".
     """
 
-    # W es una funcion en terminos de U.
-    W = get_W(
-        n_co=n_co, 
-        n_cl=n_cl,
-        m=m,
-        modo=modo
-    )
+    # W es una funcion en terminos de U (ver get_W). Aqui se escribe en linea:
+    # W = factor * U * tan(U) para m par y W = -factor * U / tan(U) para m impar,
+    # con factor = 1 en TE y (n_cl / n_co)^2 en TM. El signo no importa, W va al cuadrado.
+    if modo not in ("TE", "TM"):
+        raise ValueError(f"Modo no valido, solo se vale TM o TE, se recibio {modo}")
+    factor = (n_cl / n_co)**2
 
     k_0 = 2*math.pi / lambd
-
-    left_side_equation = lambda U : (U**2 + W(U)**2) 
     right_side_equation = (k_0 * h / 2)**2 * (n_co**2  - n_cl**2)
-    
-    # Como se tiene de la teoria que left_side_equation = right_side_equation
-    # Entonces left_side_equation - right_side_equation = 0.
-    z = lambda U : left_side_equation(U) - right_side_equation
-    
+
+    # Como se tiene de la teoria que U^2 + W^2 = right_side_equation
+    # Entonces U^2 + W^2 - right_side_equation = 0.
+    if modo == "TE":
+        # Con factor = 1, U^2 + W^2 = U^2 (1 + tan^2(U)) = U^2 / cos^2(U) para m par
+        # y U^2 (1 + 1 / tan^2(U)) = U^2 / sin^2(U) para m impar: una sola llamada
+        if m % 2 == 0:
+            def z(U):
+                c = math.cos(U)
+                return U * U / (c * c) - right_side_equation
+        else:
+            def z(U):
+                s = math.sin(U)
+                return U * U / (s * s) - right_side_equation
+    else:
+        if m % 2 == 0:
+            def z(U):
+                W = factor * U * math.tan(U)
+                return U * U + W * W - right_side_equation
+        else:
+            def z(U):
+                W = factor * U / math.tan(U)
+                return U * U + W * W - right_side_equation
+
     # Luego las raices de z son los valores de U permitidos.
     return z
 
 
+def angulo_ondulatorio(n_co, n_cl, h, lambd, m, modo):
+    """
+    Calcula el angulo de incidencia permitido (theta) de un solo modo, sin
+    resolver los demas.
+
+    Args:
+        n_co (float): Índice de refracción del núcleo de la guía de onda.
+        n_cl (float): Índice de refracción del revestimiento (cladding).
+        h (float): Altura del núcleo de la guía de onda.
+        lambd (float): Longitud de onda de la luz en el medio.
+        m (int): Número de modo de propagación (0, 1, 2, ...).
+        modo (str): Tipo de modo de propagación, "TE" o "TM".
+
+    Returns:
+        float: El angulo de incidencia theta_m en grados.
+
+    Raises:
+        ValueError: Si el modo no es "TE" o "TM", o si no hay raiz en el intervalo del modo.
+    """
+    # Intervalo de búsqueda para U según la periodicidad de la función tangente
+    l = m*math.pi/2
+    r = (m+1)*math.pi/2
+
+    # Valor valido para U en la ecuacion original
+    # (metodo de Brent: misma garantia del intervalo que biseccion, con muchas menos evaluaciones)
+    f = funcion_ondulatoria(n_co, n_cl, h, lambd, m, modo)
+    U = scipy.optimize.brentq(f, l, r) # raiz de f
+
+    # Angulo de incidencia, en grados
+    return math.degrees(math.acos((U * lambd) / (math.pi * n_co)))
+
+
 def metodo_ondulatorio(n_co, n_cl, h, lambd, ms, debug=False):
     """
     
@@ -117,22 +166,41 @@ def metodo_ondulatorio(n_co, n_cl, h, lambd, ms, debug=False):
         dict: Un diccionario con los ángulos de incidencia para los modos TE y TM en grados.
               - 'TE': Diccionario de modos TE con m como clave y theta_m en grados como valor.
               - 'TM': Diccionario de modos TM con m como clave y theta_m en grados como valor.
+
+    Los resultados se memorizan por (n_co, n_cl, h, lambd, ms); cada llamada
+    recibe sus propios diccionarios, que puede modificar sin afectar la cache.
     """
+    if debug:
+        return _calcular_angulos(n_co, n_cl, h, lambd, ms, debug)
+
+    angulos = _angulos_en_cache(n_co, n_cl, h, lambd, tuple(ms))
+    return {'TE': dict(angulos['TE']), 'TM': dict(angulos['TM'])}
+
 
+@functools.lru_cache(maxsize=128)
+def _angulos_en_cache(n_co, n_cl, h, lambd, ms):
+    """
+    Version memorizada de _calcular_angulos, con ms como tupla. El
+    diccionario retornado es compartido y no se debe modificar.
+    """
+    return _calcular_angulos(n_co, n_cl, h, lambd, ms)
+
+
+def _calcular_angulos(n_co, n_cl, h, lambd, ms, debug=False):
+    """
+    Resuelve los ángulos de incidencia de metodo_ondulatorio, sin cache.
+    """
     TEs = {} # Diccionario para almacenar los ángulos de incidencia para los modos TE
     TMs = {} # Diccionario para almacenar los ángulos de incidencia para los modos TM
 
     for m in ms:
-        # Definir el intervalo de búsqueda para U según la periodicidad de la función tangente
-        l = m*math.pi/2 
-        r = (m+1)*math.pi/2  
-        interval = (l, r) 
-
-        # Resolver para el modo TE
-        # 1. Tenemos una expresion f_TE(U) donde al igualar a 0, tenemos los valores de U permitidos
-        f_TE = funcion_ondulatoria(n_co, n_cl, h, lambd, m, "TE") 
-        
         if debug:
+            # Grafica f_TE(U), cuyas raices son los valores de U permitidos,
+            # en el intervalo de busqueda del modo
+            import matplotlib.pyplot as plt
+            l = m*math.pi/2
+            r = (m+1)*math.pi/2
+            f_TE = funcion_ondulatoria(n_co, n_cl, h, lambd, m, "TE")
             theta_values = np.linspace(l, r)
             f_TE_values = [np.log(f_TE(theta)) for theta in theta_values]
             plt.plot(theta_values, f_TE_values)
@@ -140,20 +208,9 @@ def metodo_ondulatorio(n_co, n_cl, h, lambd, ms, debug=False):
             plt.axhline(1, color='black', linewidth=1)  # Adds an x-axis at y = 0
             plt.show()
 
-        # 2. Valor valido para U en la ecuacion original
-        U_TE = scipy.optimize.root_scalar(f_TE, method="bisect", bracket=interval).root # raiz de f_TE
-
-        # 3. Calcular el angulo de incidencia
-        theta_TE = math.acos((U_TE * lambd) / (math.pi * n_co)) 
-        
-        # 4. Guardar el angulo en grados
-        TEs[m] = math.degrees(theta_TE) 
-
-        # Resolver para el modo TM, de manera similar al modo TE
-        f_TM = funcion_ondulatoria(n_co, n_cl, h, lambd, m, "TM") 
-        U_TM = scipy.optimize.root_scalar(f_TM, method="bisect" ,bracket=interval).root 
-        theta_TM = math.acos((U_TM * lambd) / (math.pi * n_co))
-        TMs[m] = math.degrees(theta_TM)
+        # Resolver los modos TE y TM, guardando los angulos en grados
+        TEs[m] = angulo_ondulatorio(n_co, n_cl, h, lambd, m, "TE")
+        TMs[m] = angulo_ondulatorio(n_co, n_cl, h, lambd, m, "TM")
 
     # Retornar los ángulos calculados para los modos TE y TM
     return {'TE': TEs, 'TM': TMs}
@@ -1,5 +1,4 @@
 from scipy.optimize import root_scalar
-import matplotlib.pyplot as plt
 import numpy as np
 import math
 
@@ -14,12 +13,25 @@ def phi(n_co, n_t, modo):
 
 def funcion_rayo(n_co, n_cl, h, lambd, m, modo):
 
-    #función phi que depende del modo (TM o TE)
-    Phi = phi(n_co, n_cl, modo)
-    k_0 = 2 * math.pi / lambd
-    
+    #función phi que depende del modo (TM o TE), escrita en linea (ver phi)
+    cociente = n_co**2 / n_cl**2
+    if modo=='TE':
+        factor = n_cl / n_co
+    elif modo=='TM':
+        factor = n_co / n_cl
+    else:
+        raise ValueError(f"Modo no valido, solo se vale TM o TE, se recibio {modo}")
+    k0h = 2 * math.pi * h / lambd
+    a = 2 * n_co * k0h
+    c = 2 * m * math.pi
+
     # La ecuación que queremos resolver
-    z = lambda theta: 2 * n_co * k_0 * h * math.cos(theta) - (4 * Phi(theta)) - (2 * m * math.pi)
+    def z(theta):
+        cos_theta = math.cos(theta)
+        sin_theta = math.sin(theta)
+        # En theta critico el radicando es 0, pero el redondeo lo puede dejar apenas negativo
+        inside_sqrt = max(cociente * sin_theta * sin_theta - 1, 0.0)
+        return a * cos_theta - 4 * math.atan(factor / cos_theta * math.sqrt(inside_sqrt)) - c
 
     return z  # Buscamos la raíz de esta función
 
@@ -34,6 +46,7 @@ def metodo_rayo(n_co, n_cl, h, lambd, ms, debug=False):
         f_TE = funcion_rayo(n_co=n_co,n_cl=n_cl,h=h, lambd=lambd, m=m, modo='TE')
         
         if debug:
+            import matplotlib.pyplot as plt
             theta_values = np.linspace(theta_c, math.pi / 2)
             f_TE_values = [f_TE(theta) for theta in theta_values]
             plt.plot(theta_values, f_TE_values)
@@ -41,12 +54,12 @@ def metodo_rayo(n_co, n_cl, h, lambd, ms, debug=False):
             plt.axhline(0, color='black', linewidth=1)  # Adds an x-axis at y = 0
             plt.show()
 
-        theta_TE = root_scalar(f_TE,method="bisect",bracket=[theta_c,math.pi/2]).root
+        theta_TE = root_scalar(f_TE,method="brentq",bracket=[theta_c,math.pi/2]).root
         TEs[m] = math.degrees(theta_TE)
 
         # resultado para modo TM
         f_TM= funcion_rayo(n_co=n_co,n_cl=n_cl,h=h,lambd=lambd,m=m, modo='TM')
-        theta_TM = root_scalar(f_TM,method="bisect",bracket=[theta_c,math.pi/2]).root
+        theta_TM = root_scalar(f_TM,method="brentq",bracket=[theta_c,math.pi/2]).root
         TMs[m] = math.degrees(theta_TM)
 
     return {'TE': TEs, 'TM': TMs}
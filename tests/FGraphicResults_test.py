@@ -0,0 +1,65 @@
+"""
+FGraphicResults_test.py
+
+Verifica la figura reutilizada de methods.FGraphicResults: que se pueda
+guardar en otros formatos y resoluciones sin romper el fondo guardado para
+update(), y la malla adaptativa de z con la que se dibujan Pa y Pb.
+"""
+
+from io import BytesIO
+import math
+
+import numpy as np
+
+import matplotlib
+matplotlib.use("Agg")  # sin ventanas; antes de que se importe pyplot
+
+from methods.FGraphicResults import FGraphicResults
+
+# Parámetros de prueba (n_eff1, n_eff2, lambd)
+f_results = FGraphicResults(n_eff1=1.45, n_eff2=1.29, lambd=1.0)
+psi = np.float32(f_results.get_psi(f_results.get_kappa(0.2)))
+N = 4
+max_tick = N * math.pi / 2
+
+
+def test_savefig_keeps_background():
+    fig = f_results.plot_F_graphs(0.2)
+    fig.canvas.draw()
+    extents = f_results._bg.get_extents()
+
+    # Guardar en PDF usa otro canvas, y a 300 dpi el dibujo es mas grande:
+    # ninguno de los dos debe reemplazar el fondo de la pantalla
+    fig.savefig(BytesIO(), format="pdf")
+    fig.savefig(BytesIO(), format="png", dpi=300)
+    assert f_results._bg.get_extents() == extents
+
+    # update() sigue pudiendo dibujar sobre el fondo
+    assert f_results.update(0.3) is fig
+
+
+def test_adaptive_grid():
+    tol = 2.5e-3
+    z, s2 = f_results._adaptive_grid(psi, max_tick, tol=tol, max_points=1000)
+
+    # Creciente y sobre todo [0, N*pi/2]
+    assert np.all(np.diff(z) > 0)
+    assert z[0] == 0 and math.isclose(z[-1], max_tick, rel_tol=1e-6)
+    assert np.array_equal(s2, np.sin(psi * z) ** 2)
+
+    # Sin llegar al limite de puntos, cada segmento se desvia menos de tol de la curva
+    assert len(z) < 1000
+    mid = (z[:-1] + z[1:]) / 2
+    assert np.all(np.abs(np.sin(psi * mid) ** 2 - (s2[:-1] + s2[1:]) / 2) <= tol)
+
+
+def test_adaptive_grid_cap():
+    # El limite de puntos se respeta aun por debajo de los puntos iniciales
+    for max_points in (10, 30, 100):
+        z, _ = f_results._adaptive_grid(psi, max_tick, max_points=max_points)
+        assert len(z) <= max_points
+        assert np.all(np.diff(z) > 0)
+
+    # x_points pide esa cantidad de puntos uniformes
+    f_results.plot_F_graphs(0.2, x_points=10)
+    assert len(f_results._pa_line.get_xdata()) == 10
@@ -0,0 +1,23 @@
+"""
+conftest.py
+
+Fixtures shared by the test modules. The solver results for the reference
+waveguide (n_co = 1.5, n_cl = 1, h = 1, lambd = 1, m = 0, 1, 2) are computed
+once per test session and reused by every test that needs them.
+"""
+
+import pytest
+from methods.metodo_ondulatorio import metodo_ondulatorio
+from methods.metodo_rayos import metodo_rayo
+
+
+@pytest.fixture(scope="session")
+def ond_result():
+    # Angulos de metodo_ondulatorio para los modos TE y TM
+    return metodo_ondulatorio(n_co=1.5, n_cl=1, h=1, lambd=1, ms=range(3))
+
+
+@pytest.fixture(scope="session")
+def ray_result():
+    # Angulos de metodo_rayo para los modos TE y TM
+    return metodo_rayo(n_co=1.5, n_cl=1, h=1, lambd=1, ms=range(3))
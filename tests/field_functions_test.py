@@ -0,0 +1,68 @@
+"""
+field_functions_test.py
+
+Verifica que los perfiles de campo de methods.field_functions, evaluados
+sobre un arreglo de NumPy, coincidan punto a punto con las expresiones por
+regiones (x < -h/2, |x| <= h/2, x > h/2) de la teoria.
+"""
+
+import numpy as np
+import math
+import methods.field_functions as ff
+
+# Parámetros de prueba (h, gamma, kappa) y rango de evaluacion
+h = 1.0
+gamma = 2.3
+kappa = 4.1
+line = np.linspace(-2 * h, 2 * h, 101)
+
+
+def par_coseno(C_0, x):
+    # Perfil par: cos(kappa x) dentro, C_0 exp(-gamma(|x| - h/2)) fuera
+    if abs(x) <= h / 2:
+        return math.cos(kappa * x)
+    return C_0 * math.exp(-gamma * (abs(x) - h / 2))
+
+
+def impar_seno(C_0, x):
+    # Perfil impar: sin(kappa x) dentro, +-C_0 exp(-gamma(|x| - h/2)) fuera
+    if abs(x) <= h / 2:
+        return math.sin(kappa * x)
+    return math.copysign(C_0, x) * math.exp(-gamma * (abs(x) - h / 2))
+
+
+def test_even_fields():
+    C_0 = math.cos(kappa * h / 2)
+    real = [par_coseno(C_0, x) for x in line]
+
+    # E_y (TE) y H_y (TM) pares tienen el mismo perfil
+    assert np.allclose(ff.get_E_y_even(h, gamma, kappa)(line), real)
+    assert np.allclose(ff.get_H_y_even(h, gamma, kappa)(line), real)
+
+    # H_z (TE) y E_z (TM) pares: -kappa sin(kappa x) dentro
+    C_0 = (kappa / gamma) * math.sin(kappa * h / 2)
+    real = [-kappa * impar_seno(gamma * C_0 / kappa, x) for x in line]
+    assert np.allclose(ff.get_H_z_even(h, gamma, kappa)(line), real)
+    assert np.allclose(ff.get_E_z_even(h, gamma, kappa)(line), real)
+
+
+def test_odd_fields():
+    C_0 = math.sin(kappa * h / 2)
+    real = [impar_seno(C_0, x) for x in line]
+
+    # E_y (TE) y H_y (TM) impares tienen el mismo perfil
+    assert np.allclose(ff.get_E_y_odd(h, gamma, kappa)(line), real)
+    assert np.allclose(ff.get_H_y_odd(h, gamma, kappa)(line), real)
+
+    # H_z (TE) y E_z (TM) impares: kappa cos(kappa x) dentro
+    C_0 = -(kappa / gamma) * math.cos(kappa * h / 2)
+    real = [kappa * par_coseno(-gamma * C_0 / kappa, x) for x in line]
+    assert np.allclose(ff.get_H_z_odd(h, gamma, kappa)(line), real)
+    assert np.allclose(ff.get_E_z_odd(h, gamma, kappa)(line), real)
+
+
+def test_scalar_input():
+    # Un solo punto debe dar el mismo valor que el arreglo
+    E_y = ff.get_E_y_odd(h, gamma, kappa)
+    assert np.isclose(E_y(line[70]), E_y(line)[70])
+    assert np.ndim(E_y(line[70])) == 0
@@ -6,120 +6,100 @@ based on the "ondulatorio" (wave-based) approach. It checks consistency
 between the computed results and known reference functions or values 
 for TE (Transverse Electric) and TM (Transverse Magnetic) modes. Specifically:
 
-- `test_TE_function()`: Compares the function `funcion_ondulatoria` (TE) 
-  against a reference function from previous optical waveguide analysis.
-- `test_TM_function()`: Similarly compares `funcion_ondulatoria` (TM) 
-  against a reference function.
-- `test_result()`: Uses `metodo_ondulatorio` to compute angles for the first 
+- `test_function()`: Compares the function `funcion_ondulatoria` against a
+  reference function from previous optical waveguide analysis, as one test
+  case per mode type (TE/TM) covering m = 0, 1, 2 at once.
+- `test_result()`: Uses `metodo_ondulatorio` (the `ond_result` fixture) to compute angles for the first 
   three modes and checks them against known reference angles.
+- `test_single_mode()`: Checks that `angulo_ondulatorio` solves one mode to
+  the same angle as `metodo_ondulatorio`.
 
 The tests rely on numeric comparisons (e.g., via `np.allclose`) to ensure 
 that the computed values are within acceptable tolerances of the 
 theoretical or reference data.
 """
 
+import itertools
 import numpy as np
 import math
-from methods.metodo_ondulatorio import funcion_ondulatoria, metodo_ondulatorio
+import pytest
+from numpy.testing import assert_allclose
+from methods.metodo_ondulatorio import funcion_ondulatoria, angulo_ondulatorio
 
+# Parámetros de la guía de onda
+n_co = 1.5  # Índice de refracción del núcleo
+n_cl = 1    # Índice de refracción del revestimiento
+h = 1       # Altura del núcleo
+lambd = 1   # Luz incidente
 
-def test_TE_function(): 
-    """
-    Verifica que la función funcion_ondulatoria para los modos TE (Transverse Electric) 
-    genere resultados consistentes con una funcion hallada anteriormente en el Taller de Fotonica y Fibras opticas.
-    Esta funcion es f_TE_reference, y ya se basa en n_co, n_cl, h, k_0 dados
+# Lado derecho (k_0 * h / 2)^2 * (n_co^2 - n_cl^2) para esta guía de onda
+K = 1.25*math.pi*math.pi
+ratio_sq = (n_cl/n_co)**2
 
-    Se prueba para los tres primeros modos (m = 0, 1, 2).
+# Conjunto de valores en los que vamos a probar las funciones
+# se evita el 0 porque se evalua en cotangente de U
+line = np.linspace(0.001, math.pi/2, 50)
 
-    Raises:
-        AssertionError: Si los valores calculados no coinciden con la referencia.
-    """
+# Valores de referencia de los angulos (grados) obtenidos previamente, para m = 0, 1, 2
+real_values_TE = np.array([75, 59.5, 43.8], dtype=np.float64)
+real_values_TM = np.array([72.9, 55.5, 42.5], dtype=np.float64)
+real_values = np.concatenate((real_values_TE, real_values_TM))
 
-    # Parámetros de la guía de onda
-    n_co = 1.5  # Índice de refracción del núcleo
-    n_cl = 1    # Índice de refracción del revestimiento
-    h = 1       # Altura del núcleo
-    lambd = 1   # Luz incidente
-    modo = "TE" # Tipo de modo (Transverse Electric)
-    
-    # Función que se hallo en el Taller de Fotonica y Fibras opticas
-    def f_TE_reference(U, m):
-        if m%2 == 0:
-            return (U*math.tan(U))**2 + U**2 - 1.25*math.pi**2
-        else:
-            return (U/math.tan(U))**2 + U**2 - 1.25*math.pi**2        
-
-    # Conjunto de valores en los que vamos a probar la funcion
-    # se evita el 0 porque se evalua en cotangente de U
-    line = np.linspace(0.001, math.pi/2, 50)
-
-    for m in range(3): 
-        # Obtener la función generada por funcion_ondulatoria
-        f = funcion_ondulatoria(
-            n_co=n_co, 
-            n_cl=n_cl, 
-            h=h, 
-            lambd=lambd,
-            m=m, 
-            modo=modo
-        )
 
-        # Evaluar la función generada y la referencia en el mismo rango
-        result = [f(x) for x in line]
-        real = [f_TE_reference(x, m) for x in line]
+# Malla (punto, modo): U como columna y m = 0, 1, 2 como fila, para evaluar
+# las referencias de los tres modos en una sola matriz (50, 3) por broadcasting
+U_grid = line[:, None]
+ms = np.arange(3)[None, :]
 
-        # Verificar que los resultados sean cercanos
-        assert np.allclose(result, real), f"Error en el modo TE m={m}"
 
-def test_TM_function(): 
+# Funciones que se hallaron en el Taller de Fotonica y Fibras opticas,
+# evaluadas sobre todo el arreglo U (y m) de una vez
+def f_TE_reference(U, m):
+    t = np.tan(U)
+    W = np.where(m%2 == 0, U*t, U/t)
+    return W*W + U*U - K
+
+def f_TM_reference(U, m):
+    t = np.tan(U)
+    W = ratio_sq * np.where(m%2 == 0, U*t, U/t)
+    return W*W + U*U - K
+
+
+@pytest.mark.parametrize("modo, f_reference", [("TE", f_TE_reference), ("TM", f_TM_reference)])
+def test_function(modo, f_reference):
     """
-    Verifica que la función funcion_ondulatoria para los modos TM (Transverse Magnetic) 
-    genere resultados consistentes con una funcion hallada anteriormente en el Taller de Fotonica y Fibras opticas.
-    Esta funcion es f_TM_reference, y ya se basa en n_co, n_cl, h, k_0 dados
+    Verifica que la función funcion_ondulatoria genere resultados consistentes con
+    una funcion hallada anteriormente en el Taller de Fotonica y Fibras opticas.
+    Esta funcion es f_TE_reference (modos TE, Transverse Electric) o f_TM_reference
+    (modos TM, Transverse Magnetic), y ya se basa en n_co, n_cl, h, k_0 dados
 
-    Se prueba para los tres primeros modos (m = 0, 1, 2).
+    Se prueba para los tres primeros modos (m = 0, 1, 2), una columna por modo.
 
     Raises:
         AssertionError: Si los valores calculados no coinciden con la referencia.
     """
 
-    # Parámetros de la guía de onda
-    n_co = 1.5  # Índice de refracción del núcleo
-    n_cl = 1    # Índice de refracción del revestimiento
-    h = 1       # Altura del núcleo
-    modo = "TM" # Tipo de modo (Transverse Magnetic)
-    lambd = 1   # Luz incidente
-
-    # Función que se hallo en el Taller de Fotonica y Fibras opticas
-    def f_TM_reference(U, m):
-        if m%2 == 0:
-            return ((n_cl/n_co)**2 * U*math.tan(U))**2 + U**2 - 1.25*math.pi**2
-        else:
-            return ((n_cl/n_co)**2 * U/math.tan(U))**2 + U**2 - 1.25*math.pi**2        
-
-    # Conjunto de valores en los que vamos a probar la funcion
-    # se evita el 0 porque se evalua en cotangente de U
-    line = np.linspace(0.001, math.pi/2, 50)
-
+    # Evaluar la función generada por funcion_ondulatoria para cada m, una columna por modo
+    result = np.empty((line.size, 3), dtype=np.float64)
     for m in range(3):
-        # Obtener la función generada por funcion_ondulatoria
         f = funcion_ondulatoria(
             n_co=n_co, 
             n_cl=n_cl, 
             h=h, 
-            lambd=lambd, 
+            lambd=lambd,
             m=m, 
             modo=modo
         )
+        result[:, m] = np.fromiter(map(f, line), dtype=np.float64, count=line.size)
 
-        # Evaluar la función generada y la referencia en el mismo rango
-        result = [f(x) for x in line]
-        real = [f_TM_reference(x, m) for x in line]
+    # La referencia en el mismo rango, para los tres modos a la vez
+    real = f_reference(U_grid, ms)
 
-        # Verificar que los resultados sean cercanos
-        assert np.allclose(result, real), f"Error en el modo TM m={m}"
+    # Verificar que los resultados sean cercanos (con las tolerancias de np.allclose),
+    # indicando los puntos (x, m) que fallen
+    assert_allclose(result, real, rtol=1e-5, atol=1e-8, err_msg=f"Error en el modo {modo}")
 
-def test_result():
+def test_result(ond_result):
     """
     Prueba la función metodo_ondulatorio verificando que los valores obtenidos 
     para los modos TE y TM sean cercanos a los valores de referencia.
@@ -137,25 +117,28 @@ def test_result():
         AssertionError: Si alguno de los valores calculados difieren por mas de 0.1 de los valores esperados.
     """
 
-    # Valores de referencia obtenidos previamente
-    real_values_TE = [75, 59.5, 43.8]
-    real_values_TM = [72.9, 55.5, 42.5]
-
-    # Ejecutar el método para calcular los ángulos de los modos TE y TM
-    result = metodo_ondulatorio(
-        n_co=1.5, 
-        n_cl=1,
-        h=1,
-        lambd=1,
-        ms=range(3) 
+    # Ángulos de los modos TE y TM calculados con metodo_ondulatorio (ver conftest.py)
+    result = ond_result
+
+    # Extraer los valores de TE seguidos de los de TM y compararlos de una vez con los esperados
+    result_array = np.fromiter(
+        itertools.chain(result['TE'].values(), result['TM'].values()), dtype=np.float64, count=6
     )
+    print("resultados py TE, TM", result_array)
+    ok = np.abs(result_array - real_values) <= 0.1
+    assert ok.all(), f"Error test result en el modo TE {ok[:3]} / TM {ok[3:]}"
+
+def test_single_mode(ond_result):
+    """
+    Verifica que angulo_ondulatorio, que resuelve un solo modo, de el mismo
+    angulo que metodo_ondulatorio para cada modo TE y TM.
 
-    # Extraer los valores de TE y compararlos con los valores esperados
-    result_TE_array = list(result['TE'].values())
-    print("resultados py TE", result_TE_array)
-    assert np.allclose(result_TE_array,real_values_TE, atol=0.1), f"Error test result en el modo TE"
+    Raises:
+        AssertionError: Si algun angulo difiere del calculado con metodo_ondulatorio.
+    """
+    result = ond_result
 
-    # Extraer los valores de TM y compararlos con los valores esperados
-    result_TM_array = list(result['TM'].values())
-    print("resultados py TM", result_TM_array)
-    assert np.allclose(result_TM_array, real_values_TM, atol=0.1), f"Error test result en el modo TM"
\ No newline at end of file
+    for modo in ("TE", "TM"):
+        for m in range(3):
+            theta = angulo_ondulatorio(n_co=1.5, n_cl=1, h=1, lambd=1, m=m, modo=modo)
+            assert math.isclose(theta, result[modo][m]), f"Error en el modo {modo} m={m}"
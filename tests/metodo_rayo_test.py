@@ -1,53 +1,62 @@
+import itertools
 import numpy as np
 import math
-from methods.metodo_rayos import funcion_rayo,metodo_rayo
+import pytest
+from numpy.testing import assert_allclose
+from methods.metodo_rayos import funcion_rayo
 
+SIX_PI = 6*math.pi
+TWO_PI = 2*math.pi
+
+# funciones de referencia, theta y m pueden ser arreglos (se combinan por broadcasting);
+# cos(theta) y sin(theta) se calculan una sola vez
 def f_TE(theta,m):
-    return 6*math.pi*math.cos(theta) - 4*math.atan((math.sqrt((2.25*math.sin(theta)**2)-1))/(1.5*math.cos(theta)))-2*m*math.pi
+    c = np.cos(theta)
+    s = np.sin(theta)
+    return SIX_PI*c - 4*np.arctan(np.sqrt(2.25*s*s - 1)/(1.5*c)) - TWO_PI*m
 
 def f_TM(theta,m):
-    return 6*math.pi*math.cos(theta) - 4*math.atan(1.5*(math.sqrt((2.25*math.sin(theta)**2)-1))/(math.cos(theta)))-2*m*math.pi
+    c = np.cos(theta)
+    s = np.sin(theta)
+    return SIX_PI*c - 4*np.arctan(1.5*np.sqrt(2.25*s*s - 1)/c) - TWO_PI*m
 
 theta_c = math.asin(2/3)
 
-def test_TE_function():
-    # prueba que la función retornada por funcion_rayo para el modo TE sea la correcta en el intervalo [theta_critico, pi/2]
-    linspace = np.linspace(theta_c, math.pi/2, 50)
-
-    # probar para valores de m=0,1,2
-    for m in range(3):
-        f_rayo = funcion_rayo(n_co=1.5,n_cl=1,h=1,lambd=1,m=0,modo='TE')
-        result = [f_rayo(theta) for theta in linspace]
-        real = [f_TE(theta, 0) for theta in linspace]
-
-        assert np.allclose(result, real)
-
+# intervalo [theta_critico, pi/2] en el que se prueban las funciones
+linspace = np.linspace(theta_c, math.pi/2, 50)
 
+# modos m=0,1,2 como columna, para evaluar las referencias en una matriz (3, 50)
+ms = np.arange(3)[:, None]
 
-def test_TM_function():
-    # prueba que la función retornada por funcion_rayo para el modo TM sea la correcta en el intervalo [theta_critico, pi/2]
-    linspace = np.linspace(theta_c, math.pi/2, 50)
+def eval_rayo(modo):
+    # evalua la función de funcion_rayo de cada modo en el intervalo, una fila por m
+    return np.stack([
+        np.fromiter(map(funcion_rayo(n_co=1.5,n_cl=1,h=1,lambd=1,m=m,modo=modo), linspace), dtype=np.float64, count=linspace.size)
+        for m in range(3)
+    ])
 
+@pytest.mark.parametrize("modo, f_reference", [('TE', f_TE), ('TM', f_TM)])
+def test_function(modo, f_reference):
+    # prueba que la función retornada por funcion_rayo para cada modo sea la correcta en el intervalo [theta_critico, pi/2]
     # probar para valores de m=0,1,2
-    for m in range(3):
-        f_rayo = funcion_rayo(n_co=1.5,n_cl=1,h=1,lambd=1,m=0,modo='TM')
-        result = [f_rayo(theta) for theta in linspace]
-        real = [f_TM(theta, 0) for theta in linspace]
+    result = eval_rayo(modo)
+    real = f_reference(linspace, ms)
 
-        assert np.allclose(result, real)
+    # mismas tolerancias de np.allclose, indicando las filas (m) y puntos que fallen
+    assert_allclose(result, real, rtol=1e-5, atol=1e-8, err_msg=f"Error en el modo {modo}")
 
 # valores reales para los angulos dado m=0,1,2
-real_values_TE = [75,59.5,43.8]
-
-real_values_TM = [72.9, 55.5, 42.5]
+real_values_TE = np.array([75,59.5,43.8], dtype=np.float64)
 
-def test_result():
-    result = metodo_rayo(n_co=1.5,n_cl=1,h=1,lambd=1,ms=range(3))
+real_values_TM = np.array([72.9, 55.5, 42.5], dtype=np.float64)
 
-    result_TE_array = list(result['TE'].values())
+# TE seguidos de TM, en el orden de test_result
+real_values = np.concatenate((real_values_TE, real_values_TM))
 
-    assert np.allclose(result_TE_array,real_values_TE, atol=0.1)
+def test_result(ray_result):
+    result = ray_result
 
-    result_TM_array = list(result['TM'].values())
+    # angulos TE seguidos de los TM, comparados de una vez
+    result_array = np.fromiter(itertools.chain(result['TE'].values(), result['TM'].values()), dtype=np.float64, count=6)
 
-    assert np.allclose(result_TM_array, real_values_TM, atol=0.1)
+    assert np.allclose(result_array, real_values, atol=0.1)